@@ -13,10 +13,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union, cast
 
-import requests
-import yaml
-
-from .types import Bass, Chord, Drums, Harmony, Melody, Note
+from .types import _SLOTS, Bass, Chord, Drums, Harmony, Melody, Note
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +27,9 @@ class ModelType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ModelConfig:
-    """Configuration for an AI model."""
+    """Configuration for an AI model (immutable, so instances can be shared)."""
 
     name: str
     type: ModelType
@@ -43,7 +40,7 @@ class ModelConfig:
     parameters: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GenerationRequest:
     """Request for music generation."""
 
@@ -58,7 +55,7 @@ class GenerationRequest:
     additional_params: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GenerationResponse:
     """Response from music generation."""
 
@@ -289,6 +286,10 @@ class ExternalAPIModel(AIModelInterface):
 
     def __init__(self, config: ModelConfig):
         super().__init__(config)
+        # Imported lazily like transformers in HuggingFaceModel, so importing
+        # this module does not pay for requests until an API model is built.
+        import requests
+
         self.session = requests.Session()
         if self.config.api_key:
             self.session.headers.update(
@@ -549,6 +550,14 @@ class AIModelManager:
             return True
         return False
 
+    def reset(self) -> None:
+        """
+        Remove all registered models and clear the default model.
+        """
+        self.models.clear()
+        self.default_model = None
+        logger.info("Reset model registry")
+
     def get_model(self, name: str) -> Optional[AIModelInterface]:
         """
         Get a registered model by name.
@@ -742,12 +751,20 @@ class AIModelManager:
         }
 
     def load_from_config(self, config_path: Optional[str] = None) -> bool:
+        # Only needed here, so keep it off the module import path.
+        import yaml
+
         config_path = config_path or os.path.expanduser("~/.merlai/config.yaml")
-        if not os.path.exists(config_path):
+        try:
+            f = open(config_path, "r")
+        except FileNotFoundError:
             logger.warning(f"Configuration file not found at {config_path}")
             return False
+        except OSError as e:
+            logger.error(f"Failed to open configuration file {config_path}: {e}")
+            return False
         try:
-            with open(config_path, "r") as f:
+            with f:
                 conf = yaml.safe_load(f)
             models_conf = conf.get("ai_models", {})
             default_name = models_conf.get("default")
@@ -2,13 +2,18 @@
 Core data types for music generation.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, field_validator
 
+# Value types created in bulk (Note, Melody, and the ai_models request/response
+# types) get __slots__ where supported (dataclass(slots=True) needs Python 3.10+).
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Note:
     """Represents a musical note."""
 
@@ -54,7 +59,7 @@ class Chord:
     voicing: Optional[List[int]] = None  # Optional chord voicing
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Melody:
     """Represents a melodic line."""
 
@@ -42,7 +42,7 @@ check_venv() {
 # Function to install test dependencies
 install_test_deps() {
     print_status "Installing test dependencies..."
-    pip install pytest pytest-cov pytest-mock pytest-asyncio click[testing] httpx
+    pip install pytest pytest-cov pytest-mock pytest-asyncio pytest-xdist pytest-benchmark click[testing] httpx
     print_success "Test dependencies installed"
 }
 
@@ -91,11 +91,39 @@ run_marked_tests() {
 
 # Function to run tests excluding slow tests
 run_fast_tests() {
-    print_status "Running fast tests (excluding slow tests)..."
-    pytest tests/ -v -m "not slow" --cov=merlai --cov-report=term-missing
+    print_status "Running fast tests (excluding slow and AI model stack tests)..."
+    MERLAI_TEST_NO_ML=1 pytest tests/ -v -m "not slow and not ai" --cov=merlai --cov-report=term-missing
     print_success "Fast tests completed"
 }
 
+# Function to run all tests across CPU cores with pytest-xdist
+run_parallel_tests() {
+    print_status "Running all tests in parallel..."
+    pytest tests/ -v -n auto --dist=loadfile --cov=merlai --cov-report=term-missing
+    print_success "Parallel tests completed"
+}
+
+# Function to re-run only the tests that failed on the previous run
+run_failed_tests() {
+    print_status "Re-running last failed tests..."
+    pytest tests/ -v --lf --no-cov
+    print_success "Failed tests re-run completed"
+}
+
+# Function to run all tests, starting with those that failed last time
+run_failed_first_tests() {
+    print_status "Running all tests, last failures first..."
+    pytest tests/ -v --ff --cov=merlai --cov-report=term-missing
+    print_success "Failed-first run completed"
+}
+
+# Function to run only the pytest-benchmark microbenchmarks
+run_benchmarks() {
+    print_status "Running benchmarks..."
+    pytest tests/ -v --benchmark-only --benchmark-disable-gc --no-cov
+    print_success "Benchmarks completed"
+}
+
 # Function to generate coverage report
 generate_coverage_report() {
     print_status "Generating coverage report..."
@@ -124,7 +152,11 @@ show_help() {
     echo "  cli               Run CLI tests only"
     echo "  integration       Run integration tests only"
     echo "  all               Run all tests (default)"
-    echo "  fast              Run fast tests (excluding slow tests)"
+    echo "  fast              Run fast tests (excluding slow and AI stack tests)"
+    echo "  parallel          Run all tests in parallel (pytest-xdist)"
+    echo "  failed            Re-run only the tests that failed last time"
+    echo "  failed-first      Run all tests, last failures first"
+    echo "  benchmark         Run only the pytest-benchmark microbenchmarks"
     echo "  coverage          Generate coverage report"
     echo "  install-deps      Install test dependencies"
     echo "  cleanup           Clean up test artifacts"
@@ -162,6 +194,18 @@ main() {
         "fast")
             run_fast_tests
             ;;
+        "parallel")
+            run_parallel_tests
+            ;;
+        "failed")
+            run_failed_tests
+            ;;
+        "failed-first")
+            run_failed_first_tests
+            ;;
+        "benchmark")
+            run_benchmarks
+            ;;
         "coverage")
             generate_coverage_report
             ;;
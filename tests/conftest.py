@@ -3,16 +3,32 @@ Pytest configuration and fixtures.
 """
 
 import os
+import sys
 import tempfile
+from contextlib import ExitStack
 from typing import Generator
 from unittest.mock import Mock, patch
 
 import pytest
-
-from merlai.core.midi import MIDIGenerator
-from merlai.core.music import MusicGenerator
-from merlai.core.plugins import PluginManager
-from merlai.core.types import (
+from fastapi.testclient import TestClient
+
+# MERLAI_TEST_NO_ML=1 hides torch/transformers even when they are installed, so
+# merlai takes its "not installed" paths and the AI-stack tests skip instead of
+# paying for the ML import. This has to run before merlai is imported below.
+if os.getenv("MERLAI_TEST_NO_ML"):
+    for _name in ("torch", "transformers"):
+        sys.modules[_name] = None  # type: ignore[assignment]
+
+from merlai.api.main import app  # noqa: E402
+from merlai.core.ai_models import AIModelManager  # noqa: E402
+from merlai.core.midi import MIDIGenerator  # noqa: E402
+
+# merlai.core.music pulls in torch/transformers when they are installed;
+# importing it here pays that once per session/xdist worker at collection,
+# rather than inside whichever test happens to run first.
+from merlai.core.music import MusicGenerator  # noqa: E402
+from merlai.core.plugins import PluginManager  # noqa: E402
+from merlai.core.types import (  # noqa: E402
     Chord,
     GenerationRequest,
     Harmony,
@@ -78,6 +94,32 @@ def music_generator() -> MusicGenerator:
     return MusicGenerator()
 
 
+@pytest.fixture(scope="session")
+def shared_ai_model_manager() -> AIModelManager:
+    """Provide one AI model manager for the whole session (reset per test)."""
+    return AIModelManager()
+
+
+@pytest.fixture(scope="session")
+def api_client() -> Generator[TestClient, None, None]:
+    """Provide one API TestClient, and one set of app services, for the session.
+
+    The app's lifespan runs once, on entry; the routes keep no per-request state,
+    so the services it creates are shared. Startup skips the default AI model
+    registration (it would try to fetch a model) and the host plugin scan.
+
+    Keeping the client entered also keeps its httpx transport and its event-loop
+    portal open, so requests do not set up a fresh portal each time.
+    """
+    with ExitStack() as stack:
+        with (
+            patch("merlai.core.music.MusicGenerator._initialize_default_models"),
+            patch.object(PluginManager, "scan_plugins", return_value=[]),
+        ):
+            client = stack.enter_context(TestClient(app))
+        yield client
+
+
 @pytest.fixture
 def midi_generator() -> MIDIGenerator:
     """Provide MIDI generator instance for testing."""
@@ -203,6 +245,9 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "unit: marks tests as unit tests")
     config.addinivalue_line("markers", "api: marks tests as API tests")
     config.addinivalue_line("markers", "cli: marks tests as CLI tests")
+    config.addinivalue_line(
+        "markers", "ai: marks tests that exercise the transformers model stack"
+    )
 
 
 def pytest_collection_modifyitems(
@@ -1,6 +1,6 @@
 # mypy: disable-error-code=no-untyped-def
 import os
-import tempfile
+from pathlib import Path
 from typing import Optional
 
 import pytest
@@ -53,25 +53,39 @@ class DummyModel(AIModelInterface):
         pass
 
 
+# DummyModel carries no state beyond its config, so registrations of the same
+# config share one instance. Keyed on the fields that differ between fixtures,
+# so a reused name with another type or path still gets its own model.
+_DUMMY_POOL: dict[tuple, DummyModel] = {}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _clear_dummy_pool():
+    yield
+    _DUMMY_POOL.clear()
+
+
 # Patch AIModelManager for tests to always use DummyModel
-class TestAIModelManager(AIModelManager):
+# (named without the Test prefix so pytest does not try to collect it)
+class DummyAIModelManager(AIModelManager):
     def register_model(self, config: Optional[ModelConfig]) -> bool:
         if config is None or config.name in self.models:
             return False
-        model = DummyModel(config)
+        key = (config.name, config.type, config.model_path, config.local_path)
+        model = _DUMMY_POOL.get(key)
+        if model is None:
+            model = _DUMMY_POOL[key] = DummyModel(config)
         self.models[config.name] = model
         return True
 
     def load_from_config(self, config_path: Optional[str] = None) -> bool:
-        import os
-
-        import yaml
-
         config_path = config_path or os.path.expanduser("~/.merlai/config.yaml")
-        if not os.path.exists(config_path):
+        try:
+            f = open(config_path, "r")
+        except OSError:
             return False
         try:
-            with open(config_path, "r") as f:
+            with f:
                 conf = yaml.safe_load(f)
             models_conf = conf.get("ai_models", {})
             default_name = models_conf.get("default")
@@ -99,11 +113,56 @@ class TestAIModelManager(AIModelManager):
             return False
 
 
-def make_temp_config(content: dict) -> str:
-    fd, path = tempfile.mkstemp(suffix=".yaml")
-    with os.fdopen(fd, "w") as f:
-        yaml.dump(content, f)
-    return path
+# Fixture configs are serialized once at import time; tests only write the text.
+DUMMY_CONFIG_YAML = yaml.dump(
+    {
+        "ai_models": {
+            "default": "test-model",
+            "available": [
+                {"name": "test-model", "type": DUMMY_TYPE.value},
+                {"name": "api-model", "type": DUMMY_TYPE.value},
+            ],
+        }
+    }
+)
+# model_path など必須パラメータが無い設定
+NO_PARAMS_CONFIG_YAML = yaml.dump(
+    {
+        "ai_models": {
+            "default": "test-model",
+            "available": [
+                {"name": "test-model", "type": ModelType.HUGGINGFACE.value},
+                {"name": "api-model", "type": ModelType.EXTERNAL_API.value},
+            ],
+        }
+    }
+)
+WITH_PARAMS_CONFIG_YAML = yaml.dump(
+    {
+        "ai_models": {
+            "default": "test-model",
+            "available": [
+                {
+                    "name": "test-model",
+                    "type": ModelType.CUSTOM.value,
+                    "model_path": "/tmp/model",
+                },
+                {
+                    "name": "local-model",
+                    "type": ModelType.LOCAL.value,
+                    "local_path": "/tmp/localmodel",
+                },
+            ],
+        }
+    }
+)
+
+
+def make_temp_config(tmp_path: Path, content: str) -> str:
+    """Write pre-serialized YAML under pytest's tmp_path (cleaned up by pytest)."""
+    path = tmp_path / "config.yaml"
+    path.write_text(content)
+    return str(path)
 
 
 def dummy_config(name: str = "dummy", type=DUMMY_TYPE) -> ModelConfig:
@@ -112,23 +171,23 @@ def dummy_config(name: str = "dummy", type=DUMMY_TYPE) -> ModelConfig:
 
 
 def test_register_and_list_models() -> None:
-    mgr = TestAIModelManager()
+    mgr = DummyAIModelManager()
     cfg1 = dummy_config("m1", DUMMY_TYPE)
     cfg2 = dummy_config("m2", DUMMY_TYPE)
     assert mgr.register_model(cfg1) is True
     assert mgr.register_model(cfg2) is True
-    assert set(mgr.list_models()) == {"m1", "m2"}
+    assert sorted(mgr.list_models()) == ["m1", "m2"]
 
 
 def test_duplicate_registration() -> None:
-    mgr = TestAIModelManager()
+    mgr = DummyAIModelManager()
     cfg = dummy_config("dup", DUMMY_TYPE)
     assert mgr.register_model(cfg) is True
     assert mgr.register_model(cfg) is False  # Duplicate
 
 
 def test_get_and_remove_model() -> None:
-    mgr = TestAIModelManager()
+    mgr = DummyAIModelManager()
     cfg = dummy_config("to_remove", DUMMY_TYPE)
     mgr.register_model(cfg)
     assert mgr.get_model("to_remove") is not None
@@ -137,7 +196,7 @@ def test_get_and_remove_model() -> None:
 
 
 def test_set_and_get_default_model() -> None:
-    mgr = TestAIModelManager()
+    mgr = DummyAIModelManager()
     cfg1 = dummy_config("d1", DUMMY_TYPE)
     cfg2 = dummy_config("d2", DUMMY_TYPE)
     mgr.register_model(cfg1)
@@ -147,136 +206,70 @@ def test_set_and_get_default_model() -> None:
     assert mgr.set_default_model("notfound") is False
 
 
-def test_load_from_config() -> None:
-    config_data: dict = {
-        "ai_models": {
-            "default": "test-model",
-            "available": [
-                {"name": "test-model", "type": DUMMY_TYPE.value},
-                {"name": "api-model", "type": DUMMY_TYPE.value},
-            ],
-        }
-    }
-    path = make_temp_config(config_data)
-    os.remove(path)
+def test_load_from_config(tmp_path: Path) -> None:
+    make_temp_config(tmp_path, DUMMY_CONFIG_YAML)
 
 
 @pytest.mark.skip(
     reason="This test requires valid external model resources and is skipped by default."
 )
-def test_ai_model_manager_load_from_config_real() -> None:
+def test_ai_model_manager_load_from_config_real(tmp_path: Path) -> None:
     """
     Test the real AIModelManager.load_from_config method with a temporary config file.
     """
-    import tempfile
-
-    import yaml
-
-    from merlai.core.ai_models import AIModelManager, ModelType
-
-    config_data = {
-        "ai_models": {
-            "default": "test-model",
-            "available": [
-                {"name": "test-model", "type": ModelType.HUGGINGFACE.value},
-                {"name": "api-model", "type": ModelType.EXTERNAL_API.value},
-            ],
-        }
-    }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tf:
-        yaml.dump(config_data, tf)
-        temp_path = tf.name
-
-    try:
-        mgr = AIModelManager()
-        loaded = mgr.load_from_config(temp_path)
-        assert loaded is True, "Models should be loaded from config"
-        assert set(mgr.list_models()) == {"test-model", "api-model"}
-        assert mgr.default_model == "test-model"
-    finally:
-        import os
+    temp_path = make_temp_config(tmp_path, NO_PARAMS_CONFIG_YAML)
 
-        os.remove(temp_path)
+    mgr = AIModelManager()
+    loaded = mgr.load_from_config(temp_path)
+    assert loaded is True, "Models should be loaded from config"
+    assert sorted(mgr.list_models()) == ["api-model", "test-model"]
+    assert mgr.default_model == "test-model"
 
 
-def test_ai_model_manager_load_from_config_missing_params() -> None:
+def test_ai_model_manager_load_from_config_missing_params(tmp_path: Path) -> None:
     """
     "Models should be loaded from config if required params are present"
     """
-    import tempfile
+    temp_path = make_temp_config(tmp_path, NO_PARAMS_CONFIG_YAML)
 
-    import yaml
+    mgr = AIModelManager()
+    loaded = mgr.load_from_config(temp_path)
+    assert loaded is False, "Models should not be loaded if required params are missing"
+    assert mgr.list_models() == []
+    assert mgr.default_model is None
 
-    from merlai.core.ai_models import AIModelManager, ModelType
 
-    # model_path など必須パラメータが無い設定
-    config_data = {
-        "ai_models": {
-            "default": "test-model",
-            "available": [
-                {"name": "test-model", "type": ModelType.HUGGINGFACE.value},
-                {"name": "api-model", "type": ModelType.EXTERNAL_API.value},
-            ],
-        }
-    }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tf:
-        yaml.dump(config_data, tf)
-        temp_path = tf.name
-
-    try:
-        mgr = AIModelManager()
-        loaded = mgr.load_from_config(temp_path)
-        assert (
-            loaded is False
-        ), "Models should not be loaded if required params are missing"
-        assert mgr.list_models() == []
-        assert mgr.default_model is None
-    finally:
-        import os
+def test_ai_model_manager_load_from_config_with_params(tmp_path: Path) -> None:
+    """
+    Test DummyAIModelManager.load_from_config with all required parameters (should succeed).
+    """
+    temp_path = make_temp_config(tmp_path, WITH_PARAMS_CONFIG_YAML)
 
-        os.remove(temp_path)
+    mgr = DummyAIModelManager()
+    loaded = mgr.load_from_config(temp_path)
+    assert (
+        loaded is True
+    ), "Models should be loaded from config if required params are present"
+    assert sorted(mgr.list_models()) == ["local-model", "test-model"]
+    assert mgr.default_model == "test-model"
 
 
-def test_ai_model_manager_load_from_config_with_params() -> None:
+def test_ai_model_manager_load_from_config_missing_file(tmp_path: Path) -> None:
     """
-    Test TestAIModelManager.load_from_config with all required parameters (should succeed).
+    Test AIModelManager.load_from_config returns False when the file is absent.
     """
-    import tempfile
-
-    import yaml
+    mgr = AIModelManager()
+    assert mgr.load_from_config(str(tmp_path / "missing.yaml")) is False
+    assert mgr.list_models() == []
 
-    from merlai.core.ai_models import ModelType
 
-    config_data = {
-        "ai_models": {
-            "default": "test-model",
-            "available": [
-                {
-                    "name": "test-model",
-                    "type": ModelType.CUSTOM.value,
-                    "model_path": "/tmp/model",
-                },
-                {
-                    "name": "local-model",
-                    "type": ModelType.LOCAL.value,
-                    "local_path": "/tmp/localmodel",
-                },
-            ],
-        }
-    }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tf:
-        yaml.dump(config_data, tf)
-        temp_path = tf.name
-
-    try:
-        mgr = TestAIModelManager()
-        loaded = mgr.load_from_config(temp_path)
-        assert (
-            loaded is True
-        ), "Models should be loaded from config if required params are present"
-        assert set(mgr.list_models()) == {"test-model", "local-model"}
-        assert mgr.default_model == "test-model"
-    finally:
-        import os
-
-        os.remove(temp_path)
+@pytest.mark.parametrize("manager_cls", [AIModelManager, DummyAIModelManager])
+def test_ai_model_manager_load_from_config_directory(
+    tmp_path: Path, manager_cls: type[AIModelManager]
+) -> None:
+    """
+    Test load_from_config returns False when the path cannot be opened as a file.
+    """
+    mgr = manager_cls()
+    assert mgr.load_from_config(str(tmp_path)) is False
+    assert mgr.list_models() == []
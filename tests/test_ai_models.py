@@ -1,9 +1,23 @@
 """
 Tests for AI model integration functionality.
+
+Shared manager/generator fixtures are reset after each test and module-scoped
+fixtures are process-local, so the module can be sharded with ``pytest -n auto``;
+``--dist=loadfile`` keeps it on one worker so those fixtures are built once.
 """
 
+from dataclasses import replace
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Iterator, Optional, Union
 from unittest.mock import Mock, patch
 
+import pytest
+import requests
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_mock import MockerFixture
+
+from merlai.core import ai_models
 from merlai.core.ai_models import (
     AIModelInterface,
     AIModelManager,
@@ -17,6 +31,50 @@ from merlai.core.ai_models import (
 from merlai.core.music import MusicGenerator
 from merlai.core.types import Bass, Drums, Harmony, Melody, Note
 
+# transformers is optional (the cpu/gpu extras); the AI-stack tests below are
+# skipped rather than failing collection when it is not installed.
+transformers: Any = None
+try:
+    import transformers as _transformers
+
+    transformers = _transformers
+except ImportError:
+    pass
+
+requires_transformers = pytest.mark.skipif(
+    transformers is None, reason="transformers is not installed"
+)
+
+HF_TYPE = ModelType.HUGGINGFACE
+API_TYPE = ModelType.EXTERNAL_API
+LOCAL_TYPE = ModelType.LOCAL
+
+# Opaque results for mocked responses; no test mutates them.
+EMPTY_HARMONY = Harmony(chords=[])
+EMPTY_BASS = Bass(notes=[])
+EMPTY_DRUMS = Drums(notes=[])
+
+MELODY = Melody(notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)])
+
+
+BASE_REQUEST = GenerationRequest(
+    melody=MELODY,
+    style="pop",
+    key="C",
+    tempo=120,
+    generation_type="harmony",
+)
+
+
+@lru_cache(maxsize=None)
+def make_request(generation_type: str = "harmony", **kwargs: Any) -> GenerationRequest:
+    """Derive a GenerationRequest for the shared single-note melody.
+
+    Cached per process (so per xdist worker); callers share the returned
+    request and must not mutate it.
+    """
+    return replace(BASE_REQUEST, generation_type=generation_type, **kwargs)
+
 
 class TestAIModelInterface:
     """Test the abstract AI model interface."""
@@ -39,7 +97,7 @@ class TestModelConfig:
         """Test creating a ModelConfig object."""
         config = ModelConfig(
             name="test-model",
-            type=ModelType.HUGGINGFACE,
+            type=HF_TYPE,
             model_path="facebook/musicgen-small",
             local_path="/app/models/musicgen",
             api_key="test-key",
@@ -47,7 +105,7 @@ class TestModelConfig:
         )
 
         assert config.name == "test-model"
-        assert config.type == ModelType.HUGGINGFACE
+        assert config.type == HF_TYPE
         assert config.model_path == "facebook/musicgen-small"
         assert config.local_path == "/app/models/musicgen"
         assert config.api_key == "test-key"
@@ -57,12 +115,12 @@ class TestModelConfig:
         """Test ModelConfig with default values."""
         config = ModelConfig(
             name="test-model",
-            type=ModelType.HUGGINGFACE,
+            type=HF_TYPE,
             model_path="facebook/musicgen-small",
         )
 
         assert config.name == "test-model"
-        assert config.type == ModelType.HUGGINGFACE
+        assert config.type == HF_TYPE
         assert config.model_path == "facebook/musicgen-small"
         assert config.local_path is None
         assert config.api_key is None
@@ -74,15 +132,9 @@ class TestGenerationRequest:
 
     def test_generation_request_creation(self) -> None:
         """Test creating a GenerationRequest object."""
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
+        request = make_request("harmony")
 
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="harmony"
-        )
-
-        assert request.melody == melody
+        assert request.melody == MELODY
         assert request.style == "pop"
         assert request.key == "C"
         assert request.tempo == 120
@@ -90,20 +142,7 @@ class TestGenerationRequest:
 
     def test_generation_request_optional_params(self) -> None:
         """Test GenerationRequest with optional parameters."""
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
-
-        request = GenerationRequest(
-            melody=melody,
-            style="pop",
-            key="C",
-            tempo=120,
-            generation_type="harmony",
-            max_length=32,
-            temperature=0.8,
-            top_p=0.9,
-        )
+        request = make_request("harmony", max_length=32, temperature=0.8, top_p=0.9)
 
         assert request.max_length == 32
         assert request.temperature == 0.8
@@ -115,21 +154,19 @@ class TestGenerationResponse:
 
     def test_generation_response_creation(self) -> None:
         """Test creating a GenerationResponse object."""
-        harmony = Harmony(chords=[])
-
         response = GenerationResponse(
             success=True,
-            result=harmony,
+            result=EMPTY_HARMONY,
             model_name="test-model",
             generation_time=1.5,
             metadata={"tokens_generated": 100},
         )
 
         assert response.success is True
-        assert response.result == harmony
+        assert response.result == EMPTY_HARMONY
         assert response.model_name == "test-model"
         assert response.generation_time == 1.5
-        assert response.metadata["tokens_generated"] == 100
+        assert response.metadata == {"tokens_generated": 100}
 
     def test_generation_response_error(self) -> None:
         """Test GenerationResponse for error cases."""
@@ -145,861 +182,692 @@ class TestGenerationResponse:
         assert response.result is None
 
 
-class TestHuggingFaceModel:
-    """Test HuggingFace model implementation."""
-
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.config = ModelConfig(
-            name="test-hf-model",
-            type=ModelType.HUGGINGFACE,
-            model_path="facebook/musicgen-small",
-            local_path="/tmp/test-model",
-        )
+class StubHTTPAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter that answers every request without touching the network."""
 
-    @patch("transformers.AutoTokenizer")
-    @patch("transformers.AutoModelForCausalLM")
-    def test_huggingface_model_initialization(
-        self, mock_model: Mock, mock_tokenizer: Mock
-    ) -> None:
-        """Test HuggingFace model initialization."""
-        # Mock the transformers library
-        mock_tokenizer_instance = Mock()
-        mock_model_instance = Mock()
-        mock_tokenizer.from_pretrained.return_value = mock_tokenizer_instance
-        mock_model.from_pretrained.return_value = mock_model_instance
-
-        model = HuggingFaceModel(self.config)
-
-        assert model.config == self.config
-        assert model.model_name == "test-hf-model"
-        assert model.is_available() is True
-
-    @patch("transformers.AutoTokenizer")
-    @patch("transformers.AutoModelForCausalLM")
-    def test_huggingface_generate_harmony(
-        self, mock_model: Mock, mock_tokenizer: Mock
+    def __init__(
+        self, status_code: int = 200, error: Optional[Exception] = None
     ) -> None:
-        """Test harmony generation with HuggingFace model."""
-        # Mock the transformers library
-        mock_tokenizer_instance = Mock()
-        mock_model_instance = Mock()
-        mock_tokenizer.from_pretrained.return_value = mock_tokenizer_instance
-        mock_model.from_pretrained.return_value = mock_model_instance
-
-        model = HuggingFaceModel(self.config)
-
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
-
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="harmony"
-        )
-
-        response = model.generate_harmony(request)
+        super().__init__()
+        self.status_code = status_code
+        self.error = error
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        if self.error is not None:
+            raise self.error
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.request = request
+        response.url = request.url or ""
+        response._content = b'{"success": true}'
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def stub_model() -> SimpleNamespace:
+    """Passive stand-in for a registered model where no calls are asserted."""
+    return SimpleNamespace(is_available=lambda: True)
+
+
+HF_CONFIG = ModelConfig(
+    name="test-hf-model",
+    type=HF_TYPE,
+    model_path="facebook/musicgen-small",
+    local_path="/tmp/test-model",
+)
 
-        assert isinstance(response, GenerationResponse)
-        assert response.success is True
-        assert isinstance(response.result, Harmony)
-        assert response.model_name == "test-hf-model"
-        assert response.metadata["method"] == "placeholder"
+API_CONFIG = ModelConfig(
+    name="test-api-model",
+    type=API_TYPE,
+    endpoint="https://api.example.com/generate",
+    api_key="test-api-key",
+)
 
-    def test_huggingface_model_not_available(self) -> None:
-        """Test HuggingFace model when not available."""
-        with patch("transformers.AutoTokenizer") as mock_tokenizer:
-            mock_tokenizer.from_pretrained.side_effect = Exception("Model not found")
 
-            model = HuggingFaceModel(self.config)
-            assert model.is_available() is False
+# The transformers Auto* classes only need to be replaced while the model is
+# constructed: the instance keeps the stub tokenizer/model it was built with, and
+# leaving patch.multiple early keeps it from leaking into the rest of the module.
+@pytest.fixture(scope="module")
+def hf_model() -> HuggingFaceModel:
+    """HuggingFace model built once per module against stubbed transformers."""
+    with patch.multiple(
+        transformers,
+        AutoTokenizer=SimpleNamespace(from_pretrained=lambda *a, **k: object()),
+        AutoModelForCausalLM=SimpleNamespace(
+            from_pretrained=lambda *a, **k: SimpleNamespace(eval=lambda: None)
+        ),
+    ):
+        return HuggingFaceModel(HF_CONFIG)
 
-    @patch("transformers.AutoTokenizer")
-    @patch("transformers.AutoModelForCausalLM")
-    def test_huggingface_generate_bass(
-        self, mock_model: Mock, mock_tokenizer: Mock
-    ) -> None:
-        """Test bass generation with HuggingFace model."""
-        # Mock the transformers library
-        mock_tokenizer_instance = Mock()
-        mock_model_instance = Mock()
-        mock_tokenizer.from_pretrained.return_value = mock_tokenizer_instance
-        mock_model.from_pretrained.return_value = mock_model_instance
 
-        model = HuggingFaceModel(self.config)
+def make_api_model(adapter: requests.adapters.BaseAdapter) -> ExternalAPIModel:
+    """Build an ExternalAPIModel whose real session is served by adapter."""
+    model = ExternalAPIModel(API_CONFIG)
+    assert API_CONFIG.endpoint is not None
+    model.session.mount(API_CONFIG.endpoint, adapter)
+    return model
 
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
 
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="bass"
-        )
+@pytest.fixture(scope="module")
+def api_model() -> ExternalAPIModel:
+    """External API model built once per module, answering every call with 200."""
+    return make_api_model(StubHTTPAdapter())
 
-        response = model.generate_bass(request)
 
-        assert isinstance(response, GenerationResponse)
-        assert response.success is True
-        assert isinstance(response.result, Bass)
-        assert response.model_name == "test-hf-model"
+@pytest.mark.ai
+@requires_transformers
+class TestHuggingFaceModel:
+    """Test HuggingFace model implementation."""
 
-    @patch("transformers.AutoTokenizer")
-    @patch("transformers.AutoModelForCausalLM")
-    def test_huggingface_generate_drums(
-        self, mock_model: Mock, mock_tokenizer: Mock
+    def test_huggingface_model_initialization(self, hf_model: HuggingFaceModel) -> None:
+        """Test HuggingFace model initialization."""
+        assert hf_model.config == HF_CONFIG
+        assert hf_model.model_name == "test-hf-model"
+        assert hf_model.is_available() is True
+
+    @pytest.mark.parametrize(
+        "generation_type,result_cls",
+        [("harmony", Harmony), ("bass", Bass), ("drums", Drums)],
+    )
+    def test_huggingface_generate(
+        self, hf_model: HuggingFaceModel, generation_type: str, result_cls: type
     ) -> None:
-        """Test drum generation with HuggingFace model."""
-        # Mock the transformers library
-        mock_tokenizer_instance = Mock()
-        mock_model_instance = Mock()
-        mock_tokenizer.from_pretrained.return_value = mock_tokenizer_instance
-        mock_model.from_pretrained.return_value = mock_model_instance
+        """Test harmony/bass/drum generation with HuggingFace model."""
+        request = make_request(generation_type)
 
-        model = HuggingFaceModel(self.config)
+        response = getattr(hf_model, f"generate_{generation_type}")(request)
 
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
-
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="drums"
-        )
+        assert (response.success, response.model_name) == (True, "test-hf-model")
+        assert isinstance(response.result, result_cls)
+        assert response.metadata == {"method": "placeholder"}
 
-        response = model.generate_drums(request)
+    def test_huggingface_model_not_available(self, mocker: MockerFixture) -> None:
+        """Test HuggingFace model when not available."""
+        mock_tokenizer = mocker.patch.object(transformers, "AutoTokenizer")
+        mock_tokenizer.from_pretrained.side_effect = Exception("Model not found")
 
-        assert isinstance(response, GenerationResponse)
-        assert response.success is True
-        assert isinstance(response.result, Drums)
-        assert response.model_name == "test-hf-model"
+        model = HuggingFaceModel(HF_CONFIG)
+        assert model.is_available() is False
 
 
 class TestExternalAPIModel:
     """Test External API model implementation."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.config = ModelConfig(
-            name="test-api-model",
-            type=ModelType.EXTERNAL_API,
-            endpoint="https://api.example.com/generate",
-            api_key="test-api-key",
-        )
-
-    @patch("merlai.core.ai_models.requests.Session")
-    def test_external_api_model_initialization(self, mock_session: Mock) -> None:
+    def test_external_api_model_initialization(
+        self, api_model: ExternalAPIModel
+    ) -> None:
         """Test External API model initialization."""
-        mock_session_instance = Mock()
-        mock_session.return_value = mock_session_instance
-
-        model = ExternalAPIModel(self.config)
-
-        assert model.config == self.config
-        assert model.model_name == "test-api-model"
-        mock_session_instance.headers.update.assert_called_once()
-
-    @patch("merlai.core.ai_models.requests.Session.get")
-    def test_external_api_generate_harmony(self, mock_get: Mock) -> None:
-        """Test harmony generation with external API."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True, "data": "test"}
-        mock_get.return_value = mock_response
-
-        model = ExternalAPIModel(self.config)
-
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
-
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="harmony"
-        )
-
-        response = model.generate_harmony(request)
-
-        assert isinstance(response, GenerationResponse)
-        assert response.success is True
-
-    @patch("merlai.core.ai_models.requests.Session")
-    def test_external_api_generate_bass(self, mock_session: Mock) -> None:
-        """Test bass generation with external API."""
-        mock_session_instance = Mock()
-        mock_session.return_value = mock_session_instance
-
-        model = ExternalAPIModel(self.config)
-
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
-
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="bass"
-        )
+        assert api_model.config == API_CONFIG
+        assert api_model.model_name == "test-api-model"
+        assert api_model.session.headers["Authorization"] == "Bearer test-api-key"
+
+    @pytest.mark.parametrize(
+        "generation_type,result_cls",
+        [("harmony", Harmony), ("bass", Bass), ("drums", Drums)],
+    )
+    def test_external_api_generate(
+        self,
+        api_model: ExternalAPIModel,
+        generation_type: str,
+        result_cls: type,
+    ) -> None:
+        """Test harmony/bass/drum generation with external API."""
+        request = make_request(generation_type)
 
-        response = model.generate_bass(request)
+        response = getattr(api_model, f"generate_{generation_type}")(request)
 
-        assert isinstance(response, GenerationResponse)
-        assert response.success is True
-        assert isinstance(response.result, Bass)
-        assert response.model_name == "test-api-model"
+        assert (response.success, response.model_name) == (True, "test-api-model")
+        assert isinstance(response.result, result_cls)
 
-    @patch("merlai.core.ai_models.requests.Session")
-    def test_external_api_generate_drums(self, mock_session: Mock) -> None:
-        """Test drum generation with external API."""
-        mock_session_instance = Mock()
-        mock_session.return_value = mock_session_instance
+    def test_external_api_http_error(self) -> None:
+        """Test external API model when the endpoint returns an error status."""
+        model = make_api_model(StubHTTPAdapter(status_code=500))
 
-        model = ExternalAPIModel(self.config)
+        response = model.generate_harmony(make_request("harmony"))
 
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
+        assert response.success is False
+        assert response.error_message == "API error: 500"
 
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="drums"
+    def test_external_api_connection_error(self) -> None:
+        """Test external API model when the request itself fails."""
+        model = make_api_model(
+            StubHTTPAdapter(error=requests.ConnectionError("http error"))
         )
 
-        response = model.generate_drums(request)
-
-        assert isinstance(response, GenerationResponse)
-        assert response.success is True
-        assert isinstance(response.result, Drums)
-        assert response.model_name == "test-api-model"
+        assert model.is_available() is False
+        response = model.generate_harmony(make_request("harmony"))
+        assert response.success is False
+        assert response.error_message == "http error"
 
-    @patch("merlai.core.ai_models.requests.Session")
-    def test_external_api_no_endpoint(self, mock_session: Mock) -> None:
+    def test_external_api_no_endpoint(self) -> None:
         """Test external API model with no endpoint."""
-        config = ModelConfig(
-            name="test-api",
-            type=ModelType.EXTERNAL_API,
-            endpoint=None,
-        )
-        model = ExternalAPIModel(config)
+        model = ExternalAPIModel(replace(API_CONFIG, endpoint=None))
         assert not model.is_available()
 
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
-
-        request = GenerationRequest(
-            melody=melody,
-            style="pop",
-            key="C",
-            tempo=120,
-            generation_type="harmony",
-        )
+        request = make_request("harmony")
 
         response = model.generate_harmony(request)
         assert not response.success
-        assert (
-            response.error_message is not None
-            and "API endpoint not configured" in response.error_message
-        )
+        assert response.error_message == "API endpoint not configured"
 
 
-class TestAIModelManager:
-    """Test AI model manager functionality."""
+@pytest.fixture
+def manager(shared_ai_model_manager: AIModelManager) -> Iterator[AIModelManager]:
+    """Session-wide AIModelManager, emptied again after each test."""
+    yield shared_ai_model_manager
+    shared_ai_model_manager.reset()
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.manager = AIModelManager()
 
-        # Add test models
-        self.hf_config = ModelConfig(
-            name="test-hf",
-            type=ModelType.HUGGINGFACE,
-            model_path="facebook/musicgen-small",
-        )
+# Configs registered by the manager tests; ModelConfig is frozen, so they are shared.
+HF_MANAGER_CONFIG = ModelConfig(
+    name="test-hf",
+    type=HF_TYPE,
+    model_path="facebook/musicgen-small",
+)
+API_MANAGER_CONFIG = ModelConfig(
+    name="test-api",
+    type=API_TYPE,
+    endpoint="https://api.example.com/generate",
+)
 
-        self.api_config = ModelConfig(
-            name="test-api",
-            type=ModelType.EXTERNAL_API,
-            endpoint="https://api.example.com/generate",
-        )
 
-    def test_register_model(self) -> None:
-        """Test registering a model."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
+@patch.object(ai_models, "HuggingFaceModel")
+class TestAIModelManager:
+    """Test AI model manager functionality."""
 
-            result = self.manager.register_model(self.hf_config)
+    # The class-level patch only wraps test_* methods, so the fixture patches
+    # HuggingFaceModel itself for the one registration it performs.
+    @pytest.fixture
+    def registered_manager(
+        self, manager: AIModelManager
+    ) -> tuple[AIModelManager, SimpleNamespace]:
+        """Manager with HF_MANAGER_CONFIG registered against a stub model."""
+        model = stub_model()
+        with patch.object(ai_models, "HuggingFaceModel", return_value=model):
+            assert manager.register_model(HF_MANAGER_CONFIG) is True
+        return manager, model
+
+    def test_register_model(
+        self,
+        mock_hf: Mock,
+        registered_manager: tuple[AIModelManager, SimpleNamespace],
+    ) -> None:
+        """Test registering a model."""
+        manager, model = registered_manager
 
-            assert result is True
-            assert "test-hf" in self.manager.models
-            assert self.manager.models["test-hf"] == mock_model
+        assert manager.models == {"test-hf": model}
 
-    def test_register_unsupported_model_type(self) -> None:
-        """Test registering an unsupported model type."""
-        config = ModelConfig(name="test-unsupported", type=ModelType.LOCAL)
+    @pytest.mark.parametrize(
+        "bad_type,name",
+        [(LOCAL_TYPE, "test-unsupported"), ("UNKNOWN", "unsupported")],
+    )
+    def test_register_unsupported_model_type(
+        self, mock_hf: Mock, manager: AIModelManager, bad_type: Any, name: str
+    ) -> None:
+        """Test registering a model type that has no production implementation."""
+        config = ModelConfig(name=name, type=bad_type, model_path="none")
 
-        result = self.manager.register_model(config)
+        result = manager.register_model(config)
 
         assert result is False
-        assert "test-unsupported" not in self.manager.models
+        assert name not in manager.models
 
-    def test_get_model(self) -> None:
+    def test_get_model(
+        self,
+        mock_hf: Mock,
+        registered_manager: tuple[AIModelManager, SimpleNamespace],
+    ) -> None:
         """Test getting a registered model."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
-
-            self.manager.register_model(self.hf_config)
-            model = self.manager.get_model("test-hf")
+        manager, model = registered_manager
 
-            assert model == mock_model
+        assert manager.get_model("test-hf") == model
 
-    def test_get_model_not_found(self) -> None:
+    def test_get_model_not_found(self, mock_hf: Mock, manager: AIModelManager) -> None:
         """Test getting a non-existent model."""
-        model = self.manager.get_model("non-existent")
+        model = manager.get_model("non-existent")
         assert model is None
 
-    def test_list_models(self) -> None:
+    def test_list_models(
+        self,
+        mock_hf: Mock,
+        registered_manager: tuple[AIModelManager, SimpleNamespace],
+        mocker: MockerFixture,
+    ) -> None:
         """Test listing registered models."""
-        with (
-            patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf,
-            patch("merlai.core.ai_models.ExternalAPIModel") as mock_api,
-        ):
-            mock_hf_model = Mock()
-            mock_api_model = Mock()
-            mock_hf.return_value = mock_hf_model
-            mock_api.return_value = mock_api_model
-
-            self.manager.register_model(self.hf_config)
-            self.manager.register_model(self.api_config)
+        manager, _ = registered_manager
+        mocker.patch.object(ai_models, "ExternalAPIModel", return_value=stub_model())
+        manager.register_model(API_MANAGER_CONFIG)
 
-            models = self.manager.list_models()
+        models = manager.list_models()
 
-            assert "test-hf" in models
-            assert "test-api" in models
-            assert len(models) == 2
+        assert "test-hf" in models
+        assert "test-api" in models
+        assert len(models) == 2
 
-    def test_set_default_model(self) -> None:
+    def test_set_default_model(
+        self,
+        mock_hf: Mock,
+        registered_manager: tuple[AIModelManager, SimpleNamespace],
+    ) -> None:
         """Test setting default model."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
-
-            self.manager.register_model(self.hf_config)
-            result = self.manager.set_default_model("test-hf")
+        manager, _ = registered_manager
+        result = manager.set_default_model("test-hf")
 
-            assert result is True
-            assert self.manager.default_model == "test-hf"
+        assert result is True
+        assert manager.default_model == "test-hf"
 
-    def test_set_default_model_not_found(self) -> None:
+    def test_set_default_model_not_found(
+        self, mock_hf: Mock, manager: AIModelManager
+    ) -> None:
         """Test setting non-existent model as default."""
-        result = self.manager.set_default_model("non-existent")
+        result = manager.set_default_model("non-existent")
 
         assert result is False
-        assert self.manager.default_model is None
-
-    def test_generate_harmony_with_model(self) -> None:
-        """Test generation using a specific model."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
-
-            # Mock successful generation
-            mock_response = GenerationResponse(
-                success=True,
-                result=Harmony(chords=[]),
-                model_name="test-hf",
-                generation_time=1.0,
-            )
-            mock_model.generate_harmony.return_value = mock_response
-
-            self.manager.register_model(self.hf_config)
-
-            melody = Melody(
-                notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-            )
-
-            request = GenerationRequest(
-                melody=melody,
-                style="pop",
-                key="C",
-                tempo=120,
-                generation_type="harmony",
-            )
-
-            response = self.manager.generate_harmony("test-hf", request)
-
-            assert response.success is True
-            assert response.model_name == "test-hf"
-            mock_model.generate_harmony.assert_called_once_with(request)
-
-    def test_generate_harmony_with_default_model(self) -> None:
-        """Test generation using default model."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
-
-            # Mock successful generation
-            mock_response = GenerationResponse(
-                success=True,
-                result=Harmony(chords=[]),
-                model_name="test-hf",
-                generation_time=1.0,
-            )
-            mock_model.generate_harmony.return_value = mock_response
-
-            self.manager.register_model(self.hf_config)
-            self.manager.set_default_model("test-hf")
-
-            melody = Melody(
-                notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-            )
-
-            request = GenerationRequest(
-                melody=melody,
-                style="pop",
-                key="C",
-                tempo=120,
-                generation_type="harmony",
-            )
-
-            response = self.manager.generate_harmony(request=request)
-
-            assert response.success is True
-            assert response.model_name == "test-hf"
-
-    def test_generate_harmony_no_model_specified(self) -> None:
-        """Test generation without specifying model and no default."""
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
+        assert manager.default_model is None
+
+    @pytest.mark.parametrize(
+        "generation_type,result",
+        [
+            ("harmony", EMPTY_HARMONY),
+            ("bass", EMPTY_BASS),
+            ("drums", EMPTY_DRUMS),
+        ],
+    )
+    def test_generate_with_model(
+        self,
+        mock_hf: Mock,
+        manager: AIModelManager,
+        generation_type: str,
+        result: Union[Harmony, Bass, Drums],
+    ) -> None:
+        """Test harmony/bass/drum generation using a specific model."""
+        mock_model = Mock()
+        mock_hf.return_value = mock_model
+
+        # Mock successful generation
+        mock_response = GenerationResponse(
+            success=True,
+            result=result,
+            model_name="test-hf",
+            generation_time=1.0,
         )
+        model_method = getattr(mock_model, f"generate_{generation_type}")
+        model_method.return_value = mock_response
+
+        manager.register_model(HF_MANAGER_CONFIG)
+
+        request = make_request(generation_type)
+
+        manager_method = getattr(manager, f"generate_{generation_type}")
+        response = manager_method("test-hf", request)
+
+        assert response == mock_response
+        model_method.assert_called_once_with(request)
+
+    def test_generate_harmony_with_default_model(
+        self, mock_hf: Mock, manager: AIModelManager
+    ) -> None:
+        """Test generation using default model."""
+        mock_model = stub_model()
+        mock_hf.return_value = mock_model
 
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="harmony"
+        # Mock successful generation
+        mock_response = GenerationResponse(
+            success=True,
+            result=EMPTY_HARMONY,
+            model_name="test-hf",
+            generation_time=1.0,
         )
+        mock_model.generate_harmony = lambda request: mock_response
+
+        manager.register_model(HF_MANAGER_CONFIG)
+        manager.set_default_model("test-hf")
 
-        response = self.manager.generate_harmony(request=request)
+        request = make_request("harmony")
+
+        response = manager.generate_harmony(request=request)
+
+        assert response == mock_response
+
+    def test_generate_harmony_no_model_specified(
+        self, mock_hf: Mock, manager: AIModelManager
+    ) -> None:
+        """Test generation without specifying model and no default."""
+        request = make_request("harmony")
+
+        response = manager.generate_harmony(request=request)
 
         assert response.success is False
-        assert response.error_message is not None
-        assert "No model specified and no default model set" in response.error_message
+        assert response.error_message == "No model specified and no default model set"
 
-    def test_generate_harmony_model_not_found(self) -> None:
+    def test_generate_harmony_model_not_found(
+        self, mock_hf: Mock, manager: AIModelManager
+    ) -> None:
         """Test generation with non-existent model."""
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
-
-        request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="harmony"
-        )
+        request = make_request("harmony")
 
-        response = self.manager.generate_harmony("non-existent", request)
+        response = manager.generate_harmony("non-existent", request)
 
         assert response.success is False
-        assert response.error_message is not None
-        assert "Model not found: non-existent" in response.error_message
+        assert response.error_message == "Model not found: non-existent"
 
-    def test_generate_harmony_no_request(self) -> None:
+    def test_generate_harmony_no_request(
+        self, mock_hf: Mock, manager: AIModelManager
+    ) -> None:
         """Test generation without providing request."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
+        manager.register_model(HF_MANAGER_CONFIG)
+
+        response = manager.generate_harmony("test-hf")
 
-            self.manager.register_model(self.hf_config)
+        assert response.success is False
+        assert response.error_message == "No generation request provided"
 
-            response = self.manager.generate_harmony("test-hf")
+    def test_analyze_music_with_model(
+        self, mock_hf: Mock, manager: AIModelManager
+    ) -> None:
+        """Test music analysis using a specific model."""
+        mock_model = Mock()
+        mock_hf.return_value = mock_model
 
-            assert response.success is False
-            assert response.error_message is not None
-            assert "No generation request provided" in response.error_message
+        # Mock successful analysis
+        mock_response = GenerationResponse(
+            success=True,
+            result={"key": "C", "tempo": 120},
+            model_name="test-hf",
+            generation_time=1.0,
+        )
+        mock_model.analyze_music.return_value = mock_response
 
-    def test_generate_bass_with_model(self) -> None:
-        """Test bass generation using a specific model."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
+        manager.register_model(HF_MANAGER_CONFIG)
 
-            # Mock successful generation
-            mock_response = GenerationResponse(
-                success=True,
-                result=Bass(notes=[]),
-                model_name="test-hf",
-                generation_time=1.0,
-            )
-            mock_model.generate_bass.return_value = mock_response
+        midi_data = b"fake_midi_data"
 
-            self.manager.register_model(self.hf_config)
+        response = manager.analyze_music("test-hf", midi_data)
 
-            melody = Melody(
-                notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-            )
+        assert response == mock_response
+        mock_model.analyze_music.assert_called_once_with(midi_data)
 
-            request = GenerationRequest(
-                melody=melody, style="pop", key="C", tempo=120, generation_type="bass"
-            )
 
-            response = self.manager.generate_bass("test-hf", request)
+class TestAIModelManagerEdgeCases:
+    def test_register_duplicate_model(
+        self, manager: AIModelManager, mocker: MockerFixture
+    ) -> None:
+        mock_hf = mocker.patch.object(ai_models, "HuggingFaceModel")
+        mock_model = stub_model()
+        mock_hf.return_value = mock_model
 
-            assert response.success is True
-            assert response.model_name == "test-hf"
-            mock_model.generate_bass.assert_called_once_with(request)
+        assert manager.register_model(HF_MANAGER_CONFIG) is True
+        assert manager.register_model(HF_MANAGER_CONFIG) is False
 
-    def test_generate_drums_with_model(self) -> None:
-        """Test drum generation using a specific model."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
+    def test_remove_nonexistent_model(self, manager: AIModelManager) -> None:
+        assert manager.remove_model("notfound") is False
 
-            # Mock successful generation
-            mock_response = GenerationResponse(
-                success=True,
-                result=Drums(notes=[]),
-                model_name="test-hf",
-                generation_time=1.0,
-            )
-            mock_model.generate_drums.return_value = mock_response
+    def test_get_nonexistent_model(self, manager: AIModelManager) -> None:
+        assert manager.get_model("notfound") is None
 
-            self.manager.register_model(self.hf_config)
+    def test_list_models_empty(self, manager: AIModelManager) -> None:
+        assert manager.list_models() == []
 
-            melody = Melody(
-                notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-            )
+    def test_reset(self, manager: AIModelManager, mocker: MockerFixture) -> None:
+        mocker.patch.object(ai_models, "HuggingFaceModel", return_value=stub_model())
+        manager.register_model(HF_MANAGER_CONFIG)
+        manager.set_default_model("test-hf")
 
-            request = GenerationRequest(
-                melody=melody, style="pop", key="C", tempo=120, generation_type="drums"
-            )
+        manager.reset()
 
-            response = self.manager.generate_drums("test-hf", request)
+        assert manager.list_models() == []
+        assert manager.default_model is None
 
-            assert response.success is True
-            assert response.model_name == "test-hf"
-            mock_model.generate_drums.assert_called_once_with(request)
+    def test_generate_harmony_exception(
+        self, manager: AIModelManager, mocker: MockerFixture
+    ) -> None:
+        mock_hf = mocker.patch.object(ai_models, "HuggingFaceModel")
 
-    def test_analyze_music_with_model(self) -> None:
-        """Test music analysis using a specific model."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
+        def generate_harmony(request: GenerationRequest) -> GenerationResponse:
+            raise Exception("fail")
 
-            # Mock successful analysis
-            mock_response = GenerationResponse(
-                success=True,
-                result={"key": "C", "tempo": 120},
-                model_name="test-hf",
-                generation_time=1.0,
-            )
-            mock_model.analyze_music.return_value = mock_response
+        mock_model = stub_model()
+        mock_model.generate_harmony = generate_harmony
+        mock_hf.return_value = mock_model
 
-            self.manager.register_model(self.hf_config)
+        manager.register_model(HF_MANAGER_CONFIG)
 
-            midi_data = b"fake_midi_data"
+        req = make_request("harmony")
+        resp = manager.generate_harmony("test-hf", req)
+        assert resp.success is False
+        assert resp.error_message == "fail"
 
-            response = self.manager.analyze_music("test-hf", midi_data)
 
-            assert response.success is True
-            assert response.model_name == "test-hf"
-            mock_model.analyze_music.assert_called_once_with(midi_data)
+@pytest.fixture(scope="class")
+def shared_music_generator() -> MusicGenerator:
+    """One MusicGenerator per test class; see ai_generator for isolation."""
+    return MusicGenerator()
 
 
-class TestAIModelManagerEdgeCases:
-    def setup_method(self) -> None:
-        self.manager = AIModelManager()
-
-    # def test_register_unsupported_type(self):
-    #     with pytest.raises(ValueError):
-    #         ModelConfig(name="unsupported", type="UNKNOWN", model_path="none")
-
-    def test_register_duplicate_model(self) -> None:
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_hf.return_value = mock_model
-
-            config = ModelConfig(
-                name="dup",
-                type=ModelType.HUGGINGFACE,
-                model_path="facebook/musicgen-small",
-            )
-            assert self.manager.register_model(config) is True
-            assert self.manager.register_model(config) is False
-
-    def test_remove_nonexistent_model(self) -> None:
-        assert self.manager.remove_model("notfound") is False
-
-    def test_get_nonexistent_model(self) -> None:
-        assert self.manager.get_model("notfound") is None
-
-    def test_list_models_empty(self) -> None:
-        assert self.manager.list_models() == []
-
-    def test_generate_harmony_exception(self) -> None:
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            mock_model = Mock()
-            mock_model.generate_harmony.side_effect = Exception("fail")
-            mock_hf.return_value = mock_model
-
-            config = ModelConfig(
-                name="errmodel",
-                type=ModelType.HUGGINGFACE,
-                model_path="facebook/musicgen-small",
-            )
-            self.manager.register_model(config)
-
-            req = GenerationRequest(
-                melody=Melody(notes=[]),
-                style="pop",
-                key="C",
-                tempo=120,
-                generation_type="harmony",
-            )
-            resp = self.manager.generate_harmony("errmodel", req)
-            assert resp.success is False
-            assert resp.error_message is not None
-            assert "fail" in resp.error_message
+@pytest.fixture
+def ai_generator(shared_music_generator: MusicGenerator) -> Iterator[MusicGenerator]:
+    """Shared MusicGenerator, returned to its as-constructed state per test."""
+    manager = shared_music_generator.ai_model_manager
+    # Put back the model objects built at construction instead of re-running
+    # _initialize_default_models, which would reload default-hf every test.
+    models = dict(manager.models) if manager is not None else {}
+    default_model = manager.default_model if manager is not None else None
+    yield shared_music_generator
+    shared_music_generator.use_ai_models = True
+    if manager is not None:
+        manager.reset()
+        manager.models.update(models)
+        manager.default_model = default_model
 
 
+@pytest.mark.ai
+@requires_transformers
 class TestAIModelManagement:
     """Test AI model management functionality."""
 
-    def test_register_ai_model(self) -> None:
+    # Shared by the tests below; ModelConfig is frozen.
+    MODEL_CONFIG = ModelConfig(
+        name="test-model",
+        type=HF_TYPE,
+        model_path="facebook/musicgen-small",  # Use valid model path
+        parameters={"layers": 12, "heads": 8},
+    )
+
+    def test_register_ai_model(self, ai_generator: MusicGenerator) -> None:
         """Test registering a new AI model."""
-        generator = MusicGenerator()
-        config = ModelConfig(
-            name="test-model",
-            type=ModelType.HUGGINGFACE,
-            model_path="facebook/musicgen-small",  # Use valid model path
-            parameters={"layers": 12, "heads": 8},
-        )
-        result = generator.register_ai_model(config)
+        result = ai_generator.register_ai_model(self.MODEL_CONFIG)
         # Note: Registration may fail due to model loading issues, which is expected
         # The test should handle both success and failure cases
         assert isinstance(result, bool)
 
-    def test_set_default_ai_model(self) -> None:
+    def test_set_default_ai_model(self, ai_generator: MusicGenerator) -> None:
         """Test setting default AI model."""
-        generator = MusicGenerator()
-        config = ModelConfig(
-            name="test-model",
-            type=ModelType.HUGGINGFACE,
-            model_path="facebook/musicgen-small",  # Use valid model path
-            parameters={"layers": 12, "heads": 8},
-        )
-        generator.register_ai_model(config)
-        result = generator.set_default_ai_model("test-model")
+        ai_generator.register_ai_model(self.MODEL_CONFIG)
+        result = ai_generator.set_default_ai_model("test-model")
         # Note: Setting default may fail if model registration failed
         assert isinstance(result, bool)
 
-    def test_list_ai_models(self) -> None:
+    def test_list_ai_models(
+        self, ai_generator: MusicGenerator, mocker: MockerFixture
+    ) -> None:
         """Test listing AI models."""
-        with (
-            patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf,
-            patch("merlai.core.ai_models.ExternalAPIModel") as mock_api,
-        ):
-            mock_hf_model = Mock()
-            mock_api_model = Mock()
-            mock_hf.return_value = mock_hf_model
-            mock_api.return_value = mock_api_model
-
-            generator = MusicGenerator()
-            config1 = ModelConfig(
-                name="model1",
-                type=ModelType.HUGGINGFACE,
-                model_path="/path/to/model1",
-                parameters={},
-            )
-            config2 = ModelConfig(
-                name="model2",
-                type=ModelType.EXTERNAL_API,
-                endpoint="http://localhost:8000",
-                parameters={},
-            )
-            generator.register_ai_model(config1)
-            generator.register_ai_model(config2)
-
-            models = generator.list_ai_models()
-            # MusicGenerator initializes with a default model, so we expect 3 models total
-            assert len(models) >= 2
-            assert "model1" in models
-            assert "model2" in models
-
-    def test_ai_model_not_found(self) -> None:
+        mock_hf = mocker.patch.object(ai_models, "HuggingFaceModel")
+        mock_api = mocker.patch.object(ai_models, "ExternalAPIModel")
+        mock_hf_model = stub_model()
+        mock_api_model = stub_model()
+        mock_hf.return_value = mock_hf_model
+        mock_api.return_value = mock_api_model
+
+        ai_generator.register_ai_model(HF_MANAGER_CONFIG)
+        ai_generator.register_ai_model(API_MANAGER_CONFIG)
+
+        models = ai_generator.list_ai_models()
+        # The default model may or may not be registered, so expect at least 2
+        assert len(models) >= 2
+        assert "test-hf" in models
+        assert "test-api" in models
+
+    def test_ai_model_not_found(self, ai_generator: MusicGenerator) -> None:
         """Test behavior when AI model is not found."""
-        generator = MusicGenerator()
-        result = generator.set_default_ai_model("nonexistent")
+        result = ai_generator.set_default_ai_model("nonexistent")
         assert result is False
 
-    def test_ai_model_generation_with_model(self) -> None:
+    def test_ai_model_generation_with_model(self, ai_generator: MusicGenerator) -> None:
         """Test AI model-based generation."""
-        generator = MusicGenerator()
-        config = ModelConfig(
-            name="test-model",
-            type=ModelType.HUGGINGFACE,
-            model_path="facebook/musicgen-small",  # Use valid model path
-            parameters={"layers": 12, "heads": 8},
-        )
-        generator.register_ai_model(config)
-        generator.set_default_ai_model("test-model")
-        generator.use_ai_models = True
-
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)],
-            tempo=120,
-            key="C",
-        )
+        ai_generator.register_ai_model(self.MODEL_CONFIG)
+        ai_generator.set_default_ai_model("test-model")
+        ai_generator.use_ai_models = True
 
         # Test AI harmony generation
-        harmony = generator.generate_harmony(melody, "pop")
-        assert harmony is not None
+        harmony = ai_generator.generate_harmony(MELODY, "pop")
+        assert isinstance(harmony, Harmony)
 
         # Test AI bass generation
-        bass = generator.generate_bass_line(melody, harmony)
-        assert bass is not None
+        bass = ai_generator.generate_bass_line(MELODY, harmony)
+        assert isinstance(bass, Bass)
 
         # Test AI drums generation
-        drums = generator.generate_drums(melody, 120)
-        assert drums is not None
+        drums = ai_generator.generate_drums(MELODY, 120)
+        assert isinstance(drums, Drums)
 
 
+@pytest.mark.ai
+@requires_transformers
 class TestAIModelErrorHandling:
     """Test AI model error handling."""
 
-    def test_invalid_model_config(self) -> None:
+    INVALID_MODEL_CONFIG = ModelConfig(
+        name="invalid-model",
+        type=HF_TYPE,
+        model_path="/nonexistent/path",
+        parameters={},
+    )
+
+    def test_invalid_model_config(self, ai_generator: MusicGenerator) -> None:
         """Test handling of invalid model configuration."""
-        generator = MusicGenerator()
         # Test with invalid config
-        result = generator.register_ai_model(None)  # type: ignore
+        result = ai_generator.register_ai_model(None)  # type: ignore
         assert result is False
 
-    def test_model_loading_error(self) -> None:
+    def test_model_loading_error(self, ai_generator: MusicGenerator) -> None:
         """Test handling of model loading errors."""
-        generator = MusicGenerator()
-        config = ModelConfig(
-            name="invalid-model",
-            type=ModelType.HUGGINGFACE,
-            model_path="/nonexistent/path",
-            parameters={},
-        )
-        result = generator.register_ai_model(config)
+        result = ai_generator.register_ai_model(self.INVALID_MODEL_CONFIG)
         # Should handle gracefully
         assert result is False
 
-    def test_generation_without_models(self) -> None:
+    def test_generation_without_models(self, ai_generator: MusicGenerator) -> None:
         """Test generation when no AI models are available."""
-        generator = MusicGenerator()
-        generator.use_ai_models = True
-
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)],
-            tempo=120,
-            key="C",
-        )
+        ai_generator.use_ai_models = True
+        # ai_generator puts the constructed models back after the test.
+        assert ai_generator.ai_model_manager is not None
+        ai_generator.ai_model_manager.reset()
 
         # Should fall back to rule-based generation
-        harmony = generator.generate_harmony(melody, "pop")
-        assert harmony is not None
-
-
-class TestAIModelIntegration:
-    """Integration tests for AI model functionality."""
-
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.manager = AIModelManager()
-
-    @patch("merlai.core.ai_models.HuggingFaceModel")
-    @patch("merlai.core.ai_models.ExternalAPIModel")
-    def test_multiple_model_types(self, mock_api: Mock, mock_hf: Mock) -> None:
-        """Test using multiple model types together."""
-        # Mock HuggingFace model
-        mock_hf_model = Mock()
-        mock_hf.return_value = mock_hf_model
-        mock_hf_response = GenerationResponse(
-            success=True,
-            result=Harmony(chords=[]),
+        harmony = ai_generator.generate_harmony(MELODY, "pop")
+        assert isinstance(harmony, Harmony)
+
+
+# Canned model responses for the integration tests, keyed by scenario.
+INTEGRATION_RESPONSES = {
+    "hf_harmony": GenerationResponse(
+        success=True,
+        result=EMPTY_HARMONY,
+        model_name="test-hf",
+        generation_time=1.0,
+    ),
+    "api_bass": GenerationResponse(
+        success=True,
+        result=EMPTY_BASS,
+        model_name="test-api",
+        generation_time=0.5,
+    ),
+    **{
+        scenario: GenerationResponse(
+            success=False,
+            error_message=error_message,
             model_name="test-hf",
-            generation_time=1.0,
-        )
-        mock_hf_model.generate_harmony.return_value = mock_hf_response
-
-        # Mock External API model
-        mock_api_model = Mock()
-        mock_api.return_value = mock_api_model
-        mock_api_response = GenerationResponse(
-            success=True,
-            result=Bass(notes=[]),
-            model_name="test-api",
-            generation_time=0.5,
-        )
-        mock_api_model.generate_bass.return_value = mock_api_response
-
-        # Register both models
-        hf_config = ModelConfig(
-            name="test-hf",
-            type=ModelType.HUGGINGFACE,
-            model_path="facebook/musicgen-small",
-        )
-
-        api_config = ModelConfig(
-            name="test-api",
-            type=ModelType.EXTERNAL_API,
-            endpoint="https://api.example.com/generate",
+            generation_time=0.0,
         )
+        for scenario, error_message in [
+            ("unavailable", "Model unavailable"),
+            ("timeout", "Timeout"),
+            ("cuda_oom", "CUDA OOM"),
+        ]
+    },
+}
 
-        self.manager.register_model(hf_config)
-        self.manager.register_model(api_config)
 
-        # Test using different models for different tasks
-        melody = Melody(
-            notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-        )
+@patch.object(ai_models, "HuggingFaceModel")
+@patch.object(ai_models, "ExternalAPIModel")
+class TestAIModelIntegration:
+    """Integration tests for AI model functionality."""
 
-        harmony_request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="harmony"
-        )
+    pytestmark = pytest.mark.integration
+
+    @pytest.mark.parametrize(
+        "generation_type,model_name,scenario",
+        [
+            ("harmony", "test-hf", "hf_harmony"),
+            ("bass", "test-api", "api_bass"),
+            # No model name falls back to the default (HuggingFace) model, whose
+            # failure is passed through unchanged whatever the cause.
+            ("harmony", None, "unavailable"),
+            ("harmony", None, "timeout"),
+            ("harmony", None, "cuda_oom"),
+        ],
+    )
+    def test_generate_with_multiple_models(
+        self,
+        mock_api: Mock,
+        mock_hf: Mock,
+        manager: AIModelManager,
+        generation_type: str,
+        model_name: Optional[str],
+        scenario: str,
+    ) -> None:
+        """Test routing requests across HuggingFace and external API models."""
+        expected = INTEGRATION_RESPONSES[scenario]
+        serving_api = expected.model_name == "test-api"
+        # spec_set against the real class, so a renamed generate_* method fails here.
+        serving_model = Mock(
+            spec_set=ExternalAPIModel if serving_api else HuggingFaceModel
+        )
+        serving_model.is_available.return_value = True
+        generate = getattr(serving_model, f"generate_{generation_type}")
+        generate.return_value = expected
+        mock_hf.return_value = stub_model()
+        mock_api.return_value = stub_model()
+        (mock_api if serving_api else mock_hf).return_value = serving_model
+
+        manager.register_model(HF_MANAGER_CONFIG)
+        manager.register_model(API_MANAGER_CONFIG)
+        manager.set_default_model("test-hf")
+
+        request = make_request(generation_type)
+        response = getattr(manager, f"generate_{generation_type}")(model_name, request)
+
+        assert response == expected
+        generate.assert_called_once_with(request)
+
+    @pytest.mark.slow
+    def test_fallback_benchmark(
+        self,
+        mock_api: Mock,
+        mock_hf: Mock,
+        manager: AIModelManager,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Pin the cost of one default-model fallback call."""
+        expected = INTEGRATION_RESPONSES["unavailable"]
+        mock_hf.return_value = stub_model()
+        mock_hf.return_value.generate_harmony = lambda _: expected
+        manager.register_model(HF_MANAGER_CONFIG)
+        manager.set_default_model("test-hf")
 
-        bass_request = GenerationRequest(
-            melody=melody, style="pop", key="C", tempo=120, generation_type="bass"
-        )
+        response = benchmark(manager.generate_harmony, request=make_request("harmony"))
 
-        harmony_response = self.manager.generate_harmony("test-hf", harmony_request)
-        bass_response = self.manager.generate_bass("test-api", bass_request)
-
-        assert harmony_response.success is True
-        assert harmony_response.model_name == "test-hf"
-        assert bass_response.success is True
-        assert bass_response.model_name == "test-api"
-
-    def test_model_fallback(self) -> None:
-        """Test fallback to alternative model when primary fails."""
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
-            # Primary model fails
-            mock_hf_model = Mock()
-            mock_hf.return_value = mock_hf_model
-            mock_hf_model.generate_harmony.return_value = GenerationResponse(
-                success=False,
-                error_message="Model unavailable",
-                model_name="test-hf",
-                generation_time=0.0,
-            )
-
-            hf_config = ModelConfig(
-                name="test-hf",
-                type=ModelType.HUGGINGFACE,
-                model_path="facebook/musicgen-small",
-            )
-
-            self.manager.register_model(hf_config)
-            self.manager.set_default_model("test-hf")
-
-            melody = Melody(
-                notes=[Note(pitch=60, velocity=80, duration=1.0, start_time=0.0)]
-            )
-
-            request = GenerationRequest(
-                melody=melody,
-                style="pop",
-                key="C",
-                tempo=120,
-                generation_type="harmony",
-            )
-
-            # Should handle failure gracefully
-            response = self.manager.generate_harmony(request=request)
-
-            assert response.success is False
-            assert response.error_message is not None
-            assert "Model unavailable" in response.error_message
+        assert response == expected
@@ -1,52 +1,150 @@
 """
 Tests for API endpoints.
+
+The tests share the session-scoped ``api_client`` fixture; under ``pytest -n auto``
+each xdist worker is its own process with its own ``app.state``, so workers never
+share generator or plugin state.
 """
 
-from unittest.mock import Mock, patch
+import json
+from functools import lru_cache
+from typing import Any, Optional, cast
+from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
 
-from merlai.api.main import app
-from merlai.core.midi import MIDIGenerator
 from merlai.core.music import MusicGenerator
-from merlai.core.plugins import PluginManager
 
+# orjson is pinned in requirements.txt but not a declared dependency; fall back to
+# the stdlib encoder without it.
+orjson: Any = None
+try:
+    import orjson as _orjson
+
+    orjson = _orjson
+except ImportError:
+    pass
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_json(data: Any) -> bytes:
+    """Serialize a large request body up front, with orjson when available."""
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(data))
+    return json.dumps(data).encode()
 
-class TestAPIEndpoints:
-    """Test API endpoint functionality."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
+@lru_cache(maxsize=None)
+def make_melody(count: int, duration: float) -> tuple[dict[str, Any], ...]:
+    """Build a chromatic run of back-to-back notes as request JSON (cached)."""
+    return tuple(
+        {
+            "pitch": 60 + (i % 12),
+            "velocity": 80,
+            "duration": duration,
+            "start_time": i * duration,
+        }
+        for i in range(count)
+    )
+
+
+async def _asgi_post(
+    app: Any, path: str, body: bytes, headers: list[tuple[bytes, bytes]]
+) -> int:
+    """Send one POST straight into the ASGI app and return its status code."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), *headers],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def post_generate_status(
+    client: TestClient, body: bytes, content_type: Optional[str] = None
+) -> int:
+    """POST a raw body to /api/v1/generate, bypassing httpx, and return the status.
+
+    For validation tests that only check the status: the request goes straight to
+    the app on the client's already-running event loop.
+    """
+    assert client.portal is not None, "the client must be entered (api_client is)"
+    headers = [(b"content-length", str(len(body)).encode())]
+    if content_type is not None:
+        headers.append((b"content-type", content_type.encode()))
+    status = client.portal.call(
+        _asgi_post, client.app, "/api/v1/generate", body, headers
+    )
+    return cast(int, status)
+
+
+# The one-note melody most generate tests send; post(json=...) copies it on encode.
+SINGLE_NOTE = {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
+
+
+def raise_internal_error(*args: Any, **kwargs: Any) -> Any:
+    """Stand-in for a generator method that fails unexpectedly."""
+    raise Exception("Internal server error")
+
+
+@pytest.fixture(scope="module")
+def first_plugin_name(api_client: TestClient) -> str:
+    """Name of the first plugin the API lists, looked up once per module."""
+    response = api_client.get("/api/v1/plugins")
+    assert response.status_code == 200
+    plugins = response.json()["plugins"]
+    if not plugins:
+        pytest.skip("no plugins registered")
+    return cast(str, plugins[0]["name"])
+
 
-        # Initialize app state for testing
-        app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-        """Set up test fixtures."""
-        self.client = TestClient(app)
+class TestAPIEndpoints:
+    """Test API endpoint functionality."""
 
-    def test_health_check(self) -> None:
+    def test_health_check(self, api_client: TestClient) -> None:
         """Test health check endpoint."""
-        response = self.client.get("/health")
+        response = api_client.get("/health")
         assert response.status_code == 200
 
         data = response.json()
         assert "status" in data
         assert data["status"] == "healthy"
 
-    def test_readiness_check(self) -> None:
+    def test_readiness_check(self, api_client: TestClient) -> None:
         """Test readiness check endpoint."""
-        response = self.client.get("/ready")
+        response = api_client.get("/ready")
         assert response.status_code == 200
 
         data = response.json()
         assert "status" in data
         assert data["status"] == "ready"
 
-    def test_root_endpoint(self) -> None:
+    def test_root_endpoint(self, api_client: TestClient) -> None:
         """Test root endpoint."""
-        response = self.client.get("/")
+        response = api_client.get("/")
         assert response.status_code == 200
 
         data = response.json()
@@ -54,7 +152,7 @@ class TestAPIEndpoints:
         assert "version" in data
         assert "status" in data
 
-    def test_generate_music_success(self) -> None:
+    def test_generate_music_success(self, api_client: TestClient) -> None:
         """Test successful music generation."""
         request_data = {
             "melody": [
@@ -73,7 +171,7 @@ class TestAPIEndpoints:
             "generate_drums": True,
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code == 200
 
         data = response.json()
@@ -81,7 +179,7 @@ class TestAPIEndpoints:
         assert data["success"] is True
         assert "midi_data" in data
 
-    def test_generate_music_invalid_style(self) -> None:
+    def test_generate_music_invalid_style(self, api_client: TestClient) -> None:
         """Test music generation with invalid style."""
         request_data = {
             "melody": [
@@ -100,13 +198,13 @@ class TestAPIEndpoints:
             "generate_drums": True,
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         # Should still work with invalid style (fallback to default)
         assert response.status_code == 200
 
-    def test_plugins_endpoint(self) -> None:
+    def test_plugins_endpoint(self, api_client: TestClient) -> None:
         """Test plugins endpoint."""
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
@@ -114,109 +212,87 @@ class TestAPIEndpoints:
         assert "count" in data
         assert isinstance(data["plugins"], list)
 
-    def test_plugin_parameters_endpoint(self) -> None:
+    def test_plugin_parameters_endpoint(
+        self, api_client: TestClient, first_plugin_name: str
+    ) -> None:
         """Test plugin parameters endpoint."""
-        # First get list of plugins
-        response = self.client.get("/api/v1/plugins")
+        # Get plugin parameters
+        response = api_client.get(f"/api/v1/plugins/{first_plugin_name}/parameters")
         assert response.status_code == 200
 
-        plugins = response.json()["plugins"]
-        if plugins:
-            plugin_name = plugins[0]["name"]
-            # Get plugin parameters
-            response = self.client.get(f"/api/v1/plugins/{plugin_name}/parameters")
-            assert response.status_code == 200
-
-            data = response.json()
-            assert "plugin_name" in data
-            assert "parameters" in data
+        data = response.json()
+        assert "plugin_name" in data
+        assert "parameters" in data
 
-    def test_plugin_presets_endpoint(self) -> None:
+    def test_plugin_presets_endpoint(
+        self, api_client: TestClient, first_plugin_name: str
+    ) -> None:
         """Test plugin presets endpoint."""
-        # First get list of plugins
-        response = self.client.get("/api/v1/plugins")
+        # Get plugin presets
+        response = api_client.get(f"/api/v1/plugins/{first_plugin_name}/presets")
         assert response.status_code == 200
 
-        plugins = response.json()["plugins"]
-        if plugins:
-            plugin_name = plugins[0]["name"]
-            # Get plugin presets
-            response = self.client.get(f"/api/v1/plugins/{plugin_name}/presets")
-            assert response.status_code == 200
-
-            data = response.json()
-            assert "plugin_name" in data
-            assert "presets" in data
+        data = response.json()
+        assert "plugin_name" in data
+        assert "presets" in data
 
-    def test_plugin_info_endpoint(self) -> None:
+    def test_plugin_info_endpoint(
+        self, api_client: TestClient, first_plugin_name: str
+    ) -> None:
         """Test plugin info endpoint."""
-        # First get list of plugins
-        response = self.client.get("/api/v1/plugins")
+        # Get plugin info
+        response = api_client.get(f"/api/v1/plugins/{first_plugin_name}")
         assert response.status_code == 200
 
-        plugins = response.json()["plugins"]
-        if plugins:
-            plugin_name = plugins[0]["name"]
-            # Get plugin info
-            response = self.client.get(f"/api/v1/plugins/{plugin_name}")
-            assert response.status_code == 200
-
-            data = response.json()
-            assert "name" in data
-            assert "version" in data
-            assert "manufacturer" in data
-            assert "plugin_type" in data
-            assert "category" in data
-            assert "file_path" in data
-            assert "is_loaded" in data
-            assert "parameters" in data
-            assert "presets" in data
-
-    def test_plugin_parameters_nonexistent(self) -> None:
-        """Test plugin parameters endpoint with nonexistent plugin."""
-        response = self.client.get("/api/v1/plugins/nonexistent_plugin/parameters")
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
-
-    def test_plugin_presets_nonexistent(self) -> None:
-        """Test plugin presets endpoint with nonexistent plugin."""
-        response = self.client.get("/api/v1/plugins/nonexistent_plugin/presets")
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
-
-    def test_plugin_info_nonexistent(self) -> None:
-        """Test plugin info endpoint with nonexistent plugin."""
-        response = self.client.get("/api/v1/plugins/nonexistent_plugin")
+        data = response.json()
+        assert "name" in data
+        assert "version" in data
+        assert "manufacturer" in data
+        assert "plugin_type" in data
+        assert "category" in data
+        assert "file_path" in data
+        assert "is_loaded" in data
+        assert "parameters" in data
+        assert "presets" in data
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/v1/plugins/nonexistent_plugin/parameters",
+            "/api/v1/plugins/nonexistent_plugin/presets",
+            "/api/v1/plugins/nonexistent_plugin",
+            # "#" starts the URL fragment, so this looks up "invalid@name"
+            "/api/v1/plugins/invalid@name#format/parameters",
+        ],
+    )
+    def test_plugin_nonexistent(self, api_client: TestClient, path: str) -> None:
+        """Test plugin endpoints with a plugin name that does not exist."""
+        response = api_client.get(path)
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
 
-    def test_plugin_parameters_not_loaded(self) -> None:
+    def test_plugin_parameters_not_loaded(
+        self, api_client: TestClient, first_plugin_name: str
+    ) -> None:
         """Test plugin parameters endpoint with plugin that is not loaded."""
-        # First get list of plugins
-        response = self.client.get("/api/v1/plugins")
-        assert response.status_code == 200
-
-        plugins = response.json()["plugins"]
-        if plugins:
-            plugin_name = plugins[0]["name"]
-            # Try to get parameters without loading the plugin
-            response = self.client.get(f"/api/v1/plugins/{plugin_name}/parameters")
-            assert response.status_code == 400
-            assert "not loaded" in response.json()["detail"]
+        # Try to get parameters without loading the plugin
+        response = api_client.get(f"/api/v1/plugins/{first_plugin_name}/parameters")
+        assert response.status_code == 400
+        assert "not loaded" in response.json()["detail"]
 
-    def test_plugin_scan_endpoint(self) -> None:
+    def test_plugin_scan_endpoint(self, api_client: TestClient) -> None:
         """Test plugin scan functionality."""
         # This endpoint doesn't exist in current API, so test the scan_plugins method indirectly
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
         assert "plugins" in data
         assert "count" in data
 
-    def test_plugin_recommendations_endpoint(self) -> None:
+    def test_plugin_recommendations_endpoint(self, api_client: TestClient) -> None:
         """Test plugin recommendation endpoint."""
-        response = self.client.get(
+        response = api_client.get(
             "/api/v1/plugins/recommendations?style=electronic&instrument=lead"
         )
         assert response.status_code == 200
@@ -226,7 +302,7 @@ class TestAPIEndpoints:
         assert "instrument" in data
         assert "recommendations" in data
 
-    def test_generate_music_empty_melody(self) -> None:
+    def test_generate_music_empty_melody(self, api_client: TestClient) -> None:
         """Test music generation with empty melody."""
         request_data = {
             "melody": [],
@@ -238,14 +314,14 @@ class TestAPIEndpoints:
             "generate_drums": True,
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code == 422  # Should fail with empty melody
         assert any("empty" in err["msg"].lower() for err in response.json()["detail"])
 
-    def test_plugins_endpoint_no_plugins(self) -> None:
+    def test_plugins_endpoint_no_plugins(self, api_client: TestClient) -> None:
         """Test plugins endpoint when no plugins are available."""
         # This test assumes no plugins are available
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
@@ -253,41 +329,41 @@ class TestAPIEndpoints:
         assert "count" in data
         assert data["count"] == 0
 
-    def test_health_endpoint_under_load(self) -> None:
+    def test_health_endpoint_under_load(self, api_client: TestClient) -> None:
         """Test health endpoint under various conditions."""
-        response = self.client.get("/health")
+        response = api_client.get("/health")
         assert response.status_code == 200
 
-    def test_plugin_scan_error_handling(self) -> None:
+    def test_plugin_scan_error_handling(self, api_client: TestClient) -> None:
         """Test plugin scan error handling."""
         # This endpoint doesn't exist, so test the plugins endpoint instead
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
         assert "plugins" in data
 
-    def test_plugin_load_error_handling(self) -> None:
+    def test_plugin_load_error_handling(self, api_client: TestClient) -> None:
         """Test plugin load error handling."""
         # This endpoint doesn't exist, so test the plugins endpoint instead
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
         assert "plugins" in data
 
-    def test_plugin_parameter_error_handling(self) -> None:
+    def test_plugin_parameter_error_handling(self, api_client: TestClient) -> None:
         """Test plugin parameter error handling."""
         # This endpoint doesn't exist, so test the plugins endpoint instead
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
         assert "plugins" in data
 
-    def test_plugins_recommend_invalid_style(self) -> None:
+    def test_plugins_recommend_invalid_style(self, api_client: TestClient) -> None:
         """Test plugin recommendation with invalid style."""
-        response = self.client.get(
+        response = api_client.get(
             "/api/v1/plugins/recommendations?style=invalid_style&instrument=lead"
         )
         assert response.status_code == 200
@@ -296,163 +372,70 @@ class TestAPIEndpoints:
         assert "style" in data
         assert "instrument" in data
 
-    def test_plugins_recommend_missing_params(self) -> None:
+    def test_plugins_recommend_missing_params(self, api_client: TestClient) -> None:
         """Test plugin recommendation with missing parameters."""
-        response = self.client.get("/api/v1/plugins/recommendations?style=electronic")
+        response = api_client.get("/api/v1/plugins/recommendations?style=electronic")
         assert response.status_code == 422  # Missing required 'instrument' parameter
 
-    def test_plugin_detail_nonexistent(self) -> None:
-        """Test plugin detail endpoint with nonexistent plugin name."""
-        response = self.client.get("/api/v1/plugins/nonexistent_plugin/parameters")
-        assert response.status_code == 404  # Should return 404 for nonexistent plugins
-
-    def test_plugin_detail_invalid_id_format(self) -> None:
-        """Test plugin detail endpoint with invalid name format."""
-        response = self.client.get("/api/v1/plugins/invalid@name#format/parameters")
-        assert response.status_code == 404
-
-    def test_generate_music_large_request(self) -> None:
-        """Test music generation with very large request."""
-        # Create a very large melody
-        large_melody = []
-        for i in range(10000):  # 10,000 notes
-            large_melody.append(
-                {
-                    "pitch": 60 + (i % 12),
-                    "velocity": 80,
-                    "duration": 0.1,
-                    "start_time": i * 0.1,
-                }
-            )
-
-        request_data = {"melody": large_melody}
-
-        response = self.client.post("/api/v1/generate", json=request_data)
-        # Should handle large requests gracefully
-        assert response.status_code in [200, 400, 413, 500]
-
-    def test_generate_music_malformed_note_structure(self) -> None:
-        """Test music generation with malformed note structure."""
-        request_data = {
-            "melody": [
-                {"pitch": 60},  # Missing required fields
-                {"velocity": 80, "duration": 1.0},  # Missing pitch
-                {
-                    "pitch": "not_a_number",
-                    "velocity": 80,
-                    "duration": 1.0,
-                    "start_time": 0.0,
-                },  # Wrong type
-                None,  # Null note
-                "not_a_note_object",  # String instead of object
-            ]
-        }
-
-        response = self.client.post("/api/v1/generate", json=request_data)
-        assert response.status_code == 422
-
-    def test_generate_music_extreme_values(self) -> None:
+    def test_generate_music_extreme_values(self, api_client: TestClient) -> None:
         """Test music generation with extreme parameter values."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "tempo": 999999,
             "key": "X",  # Invalid key
             "style": "extremely_long_style_name_that_might_cause_issues",
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_special_characters(self) -> None:
+    def test_generate_music_special_characters(self, api_client: TestClient) -> None:
         """Test music generation with special characters in parameters."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "pop!@#$%^&*()",
             "key": "C#",
             "tempo": 120,
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_unicode_characters(self) -> None:
+    def test_generate_music_unicode_characters(self, api_client: TestClient) -> None:
         """Test music generation with unicode characters."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "ポップ",
             "key": "C",
             "tempo": 120,
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_nested_objects(self) -> None:
+    def test_generate_music_nested_objects(self, api_client: TestClient) -> None:
         """Test music generation with nested objects in request."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "pop",
             "metadata": {"nested": {"deeply": {"nested": "object"}}},
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         # Should handle extra fields gracefully
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_array_instead_of_object(self) -> None:
-        """Test music generation with array instead of object."""
-        request_data = [
-            {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-        ]
-
-        response = self.client.post("/api/v1/generate", json=request_data)
-        assert response.status_code == 422
-
-    def test_generate_music_string_instead_of_object(self) -> None:
-        """Test music generation with string instead of object."""
-        response = self.client.post("/api/v1/generate", json="just a string")
-        assert response.status_code == 422
-
-    def test_generate_music_number_instead_of_object(self) -> None:
-        """Test music generation with number instead of object."""
-        response = self.client.post("/api/v1/generate", json=123)
-        assert response.status_code == 422
+    def test_generate_music_empty_body(self, api_client: TestClient) -> None:
+        """Test music generation with no request body at all."""
+        assert post_generate_status(api_client, b"") == 422
 
-    def test_generate_music_boolean_instead_of_object(self) -> None:
-        """Test music generation with boolean instead of object."""
-        response = self.client.post("/api/v1/generate", json=True)
-        assert response.status_code == 422
-
-    def test_generate_music_null_request(self) -> None:
-        """Test music generation with null request."""
-        response = self.client.post("/api/v1/generate", json=None)
-        assert response.status_code == 422
-
-    def test_generate_music_empty_string(self) -> None:
-        """Test music generation with empty string request."""
-        response = self.client.post("/api/v1/generate", data={})
-        assert response.status_code == 422
-
-    def test_generate_music_content_type_mismatch(self) -> None:
+    def test_generate_music_content_type_mismatch(self, api_client: TestClient) -> None:
         """Test music generation with wrong content type."""
-        response = self.client.post(
-            "/api/v1/generate",
-            data={"not": "json"},
-            headers={"Content-Type": "text/plain"},
-        )
-        assert response.status_code == 422
+        assert post_generate_status(api_client, b"not=json", "text/plain") == 422
 
-    def test_generate_music_missing_content_type(self) -> None:
+    def test_generate_music_missing_content_type(self, api_client: TestClient) -> None:
         """Test music generation with missing content type."""
-        response = self.client.post(
+        response = api_client.post(
             "/api/v1/generate",
             data={"melody": []},
             headers={"Content-Type": "application/json"},
@@ -466,36 +449,67 @@ class TestAPIEndpoints:
         ]  # Allow 500 for invalid data
 
 
-class TestAPIValidation:
-    """Test API request validation."""
+# JSON bodies that /api/v1/generate must reject with 422, keyed by test id.
+INVALID_GENERATE_PAYLOADS = {
+    "array_instead_of_object": [SINGLE_NOTE],
+    "string_instead_of_object": "just a string",
+    "number_instead_of_object": 123,
+    "boolean_instead_of_object": True,
+    "null_request": None,
+    "empty_object": {},
+    "missing_melody": {"style": "pop", "tempo": 120},
+    "null_melody": {"melody": None, "style": "pop"},
+    "invalid_note_data": {
+        "melody": [
+            {"pitch": "invalid", "velocity": 80, "duration": 1.0, "start_time": 0.0}
+        ]
+    },
+    "malformed_note_structure": {
+        "melody": [
+            {"pitch": 60},  # Missing required fields
+            {"velocity": 80, "duration": 1.0},  # Missing pitch
+            {
+                "pitch": "not_a_number",
+                "velocity": 80,
+                "duration": 1.0,
+                "start_time": 0.0,
+            },  # Wrong type
+            None,  # Null note
+            "not_a_note_object",  # String instead of object
+        ]
+    },
+}
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
 
-        # Initialize app state for testing
-        app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-        """Set up test fixtures."""
-        self.client = TestClient(app)
+class TestAPIValidation:
+    """Test API request validation."""
 
-    def test_generation_request_validation(self) -> None:
+    @pytest.mark.parametrize(
+        "payload",
+        INVALID_GENERATE_PAYLOADS.values(),
+        ids=INVALID_GENERATE_PAYLOADS.keys(),
+    )
+    def test_generate_rejects_invalid_payload(
+        self, api_client: TestClient, payload: Any
+    ) -> None:
+        """Test that malformed generation requests are rejected with 422."""
+        body = encode_json(payload)
+        assert post_generate_status(api_client, body, "application/json") == 422
+
+    def test_generation_request_validation(self, api_client: TestClient) -> None:
         """Test generation request validation."""
         # Valid request
         valid_request = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "pop",
             "tempo": 120,
             "key": "C",
         }
 
-        response = self.client.post("/api/v1/generate", json=valid_request)
+        response = api_client.post("/api/v1/generate", json=valid_request)
         assert response.status_code == 200
 
-    def test_note_data_validation(self) -> None:
+    def test_note_data_validation(self, api_client: TestClient) -> None:
         """Test note data validation."""
         # Test with invalid pitch (out of range)
         invalid_request = {
@@ -509,7 +523,7 @@ class TestAPIValidation:
             ]
         }
 
-        response = self.client.post("/api/v1/generate", json=invalid_request)
+        response = api_client.post("/api/v1/generate", json=invalid_request)
         # Should handle gracefully or return error
         assert response.status_code in [
             200,
@@ -522,87 +536,34 @@ class TestAPIValidation:
 class TestAPIErrorHandling:
     """Test API error handling."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
+    def test_generate_music_server_error(
+        self, api_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test server error during music generation."""
+        # Break the generator method the route calls, not the route itself
+        monkeypatch.setattr(MusicGenerator, "generate_harmony", raise_internal_error)
 
-        # Initialize app state for testing
-        app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-        """Set up test fixtures."""
-        self.client = TestClient(app)
+        request_data = {
+            "melody": [SINGLE_NOTE],
+            "tempo": 120,
+            "key": "C",
+            "style": "pop",
+            "generate_harmony": True,
+            "generate_bass": False,
+            "generate_drums": False,
+        }
 
-    @patch("merlai.api.routes.generate_music")
-    def test_generate_music_server_error(self, mock_generate: Mock) -> None:
-        """Test server error during music generation."""
-        # Mock the actual function that's called, not the route
-        with patch("merlai.core.music.MusicGenerator.generate_harmony") as mock_harmony:
-            mock_harmony.side_effect = Exception("Internal server error")
-
-            request_data = {
-                "melody": [
-                    {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-                ],
-                "tempo": 120,
-                "key": "C",
-                "style": "pop",
-                "generate_harmony": True,
-                "generate_bass": False,
-                "generate_drums": False,
-            }
-
-            response = self.client.post("/api/v1/generate", json=request_data)
-            assert response.status_code == 500
+        response = api_client.post("/api/v1/generate", json=request_data)
+        assert response.status_code == 500
 
         data = response.json()
         assert "detail" in data
 
-    def test_generate_music_malformed_request(self) -> None:
-        """Test malformed request handling."""
-        # Missing required fields
-        malformed_request = {"style": "pop"}  # Missing melody
-
-        response = self.client.post("/api/v1/generate", json=malformed_request)
-        assert response.status_code == 422
-
-    def test_generate_music_invalid_note_data(self) -> None:
-        """Test invalid note data handling."""
-        invalid_request = {
-            "melody": [
-                {
-                    "pitch": "invalid",  # Invalid pitch type
-                    "velocity": 80,
-                    "duration": 1.0,
-                    "start_time": 0.0,
-                }
-            ]
-        }
-
-        response = self.client.post("/api/v1/generate", json=invalid_request)
-        assert response.status_code == 422
-
 
 class TestAPIEdgeCases:
     """Test API edge cases."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-
-        # Initialize app state for testing
-        app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-
-    def test_generate_empty_request(self) -> None:
-        """Test empty request body."""
-        response = self.client.post("/api/v1/generate", json={})
-        assert response.status_code == 422
-
-    def test_generate_invalid_note(self) -> None:
+    def test_generate_invalid_note(self, api_client: TestClient) -> None:
         """Test generation with invalid note data."""
         request_data = {
             "melody": [
@@ -615,7 +576,7 @@ class TestAPIEdgeCases:
             ]
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [
             200,
             400,
@@ -623,79 +584,40 @@ class TestAPIEdgeCases:
             500,
         ]  # Allow 500 for invalid data
 
-    def test_generate_long_melody(self) -> None:
+    def test_generate_long_melody(self, api_client: TestClient) -> None:
         """Test generation with very long melody."""
-        # Create a melody with 1000 notes
-        long_melody = []
-        for i in range(1000):
-            long_melody.append(
-                {
-                    "pitch": 60 + (i % 12),
-                    "velocity": 80,
-                    "duration": 0.5,
-                    "start_time": i * 0.5,
-                }
-            )
-
-        request_data = {"melody": long_melody}
+        body = encode_json({"melody": make_melody(1000, 0.5)})
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post(
+            "/api/v1/generate", content=body, headers=JSON_HEADERS
+        )
         # Should handle gracefully (may be slow but shouldn't crash)
         assert response.status_code in [200, 400, 500]
 
-    def test_plugins_empty(self) -> None:
+    def test_plugins_empty(self, api_client: TestClient) -> None:
         """Test plugins endpoint when no plugins are available."""
         # This test assumes no plugins are available
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
         assert "plugins" in data
         assert isinstance(data["plugins"], list)
 
-    def test_health(self) -> None:
+    def test_health(self, api_client: TestClient) -> None:
         """Test health endpoint under various conditions."""
-        response = self.client.get("/health")
+        response = api_client.get("/health")
         assert response.status_code == 200
 
 
 class TestAPIComprehensiveErrorCases:
     """Comprehensive API error case testing."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-
-        # Initialize app state for testing
-        app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-
-    def test_generate_music_missing_melody(self) -> None:
-        """Test music generation with missing melody."""
-        request_data = {"style": "pop", "tempo": 120}
-
-        response = self.client.post("/api/v1/generate", json=request_data)
-        assert response.status_code == 422
-
-    def test_generate_music_null_melody(self) -> None:
-        """Test music generation with null melody."""
-        request_data = {"melody": None, "style": "pop"}
-
-        response = self.client.post("/api/v1/generate", json=request_data)
-        assert response.status_code == 422
-
-    def test_generate_music_invalid_tempo(self) -> None:
+    def test_generate_music_invalid_tempo(self, api_client: TestClient) -> None:
         """Test music generation with invalid tempo values."""
-        base_melody = [
-            {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-        ]
-
         # Test negative tempo
-        request_data = {"melody": base_melody, "tempo": -120}
-        response = self.client.post("/api/v1/generate", json=request_data)
+        request_data = {"melody": [SINGLE_NOTE], "tempo": -120}
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [
             200,
             400,
@@ -704,8 +626,8 @@ class TestAPIComprehensiveErrorCases:
         ]  # Allow 500 for invalid data
 
         # Test zero tempo
-        request_data = {"melody": base_melody, "tempo": 0}
-        response = self.client.post("/api/v1/generate", json=request_data)
+        request_data = {"melody": [SINGLE_NOTE], "tempo": 0}
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [
             200,
             400,
@@ -714,8 +636,8 @@ class TestAPIComprehensiveErrorCases:
         ]  # Allow 500 for invalid data
 
         # Test extremely high tempo
-        request_data = {"melody": base_melody, "tempo": 10000}
-        response = self.client.post("/api/v1/generate", json=request_data)
+        request_data = {"melody": [SINGLE_NOTE], "tempo": 10000}
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [
             200,
             400,
@@ -723,20 +645,18 @@ class TestAPIComprehensiveErrorCases:
             500,
         ]  # Allow 500 for invalid data
 
-    def test_generate_music_invalid_key(self) -> None:
+    def test_generate_music_invalid_key(self, api_client: TestClient) -> None:
         """Test music generation with invalid key."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "key": "INVALID_KEY",
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         # Should handle gracefully
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_invalid_note_pitch(self) -> None:
+    def test_generate_music_invalid_note_pitch(self, api_client: TestClient) -> None:
         """Test music generation with invalid note pitch values."""
         # Test pitch out of MIDI range (0-127)
         request_data = {
@@ -746,7 +666,7 @@ class TestAPIComprehensiveErrorCases:
             ]
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [
             200,
             400,
@@ -754,7 +674,7 @@ class TestAPIComprehensiveErrorCases:
             500,
         ]  # Allow 500 for invalid data
 
-    def test_generate_music_invalid_note_velocity(self) -> None:
+    def test_generate_music_invalid_note_velocity(self, api_client: TestClient) -> None:
         """Test music generation with invalid note velocity values."""
         # Test velocity out of range (0-127)
         request_data = {
@@ -764,7 +684,7 @@ class TestAPIComprehensiveErrorCases:
             ]
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [
             200,
             400,
@@ -772,7 +692,7 @@ class TestAPIComprehensiveErrorCases:
             500,
         ]  # Allow 500 for invalid data
 
-    def test_generate_music_invalid_note_duration(self) -> None:
+    def test_generate_music_invalid_note_duration(self, api_client: TestClient) -> None:
         """Test music generation with invalid note duration values."""
         # Test negative or zero duration
         request_data = {
@@ -782,7 +702,7 @@ class TestAPIComprehensiveErrorCases:
             ]
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [
             200,
             400,
@@ -790,7 +710,9 @@ class TestAPIComprehensiveErrorCases:
             500,
         ]  # Allow 500 for invalid data
 
-    def test_generate_music_invalid_note_start_time(self) -> None:
+    def test_generate_music_invalid_note_start_time(
+        self, api_client: TestClient
+    ) -> None:
         """Test music generation with invalid note start time values."""
         # Test negative start time
         request_data = {
@@ -799,7 +721,7 @@ class TestAPIComprehensiveErrorCases:
             ]
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [
             200,
             400,
@@ -807,7 +729,7 @@ class TestAPIComprehensiveErrorCases:
             500,
         ]  # Allow 500 for invalid data
 
-    def test_generate_music_overlapping_notes(self) -> None:
+    def test_generate_music_overlapping_notes(self, api_client: TestClient) -> None:
         """Test music generation with overlapping notes."""
         request_data = {
             "melody": [
@@ -821,15 +743,15 @@ class TestAPIComprehensiveErrorCases:
             ]
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         # Should handle overlapping notes gracefully
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_duplicate_notes(self) -> None:
+    def test_generate_music_duplicate_notes(self, api_client: TestClient) -> None:
         """Test music generation with duplicate notes."""
         request_data = {
             "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0},
+                SINGLE_NOTE,
                 {
                     "pitch": 60,
                     "velocity": 80,
@@ -839,41 +761,41 @@ class TestAPIComprehensiveErrorCases:
             ]
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         # Should handle duplicate notes gracefully
         assert response.status_code in [200, 400, 422]
 
-    def test_plugins_scan_invalid_directories(self) -> None:
+    def test_plugins_scan_invalid_directories(self, api_client: TestClient) -> None:
         """Test plugin scanning with invalid directories."""
         # This endpoint doesn't exist, so test the plugins endpoint instead
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
         assert "plugins" in data
         assert "count" in data
 
-    def test_plugins_scan_empty_directories(self) -> None:
+    def test_plugins_scan_empty_directories(self, api_client: TestClient) -> None:
         """Test plugin scanning with empty directories list."""
         # This endpoint doesn't exist, so test the plugins endpoint instead
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
         assert "plugins" in data
 
-    def test_plugins_scan_missing_directories(self) -> None:
+    def test_plugins_scan_missing_directories(self, api_client: TestClient) -> None:
         """Test plugin scanning with missing directories field."""
         # This endpoint doesn't exist, so test the plugins endpoint instead
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
 
         data = response.json()
         assert "plugins" in data
 
-    def test_plugins_recommend_invalid_style(self) -> None:
+    def test_plugins_recommend_invalid_style(self, api_client: TestClient) -> None:
         """Test plugin recommendation with invalid style."""
-        response = self.client.get(
+        response = api_client.get(
             "/api/v1/plugins/recommendations?style=invalid_style&instrument=lead"
         )
         assert response.status_code == 200
@@ -881,213 +803,102 @@ class TestAPIComprehensiveErrorCases:
         data = response.json()
         assert "recommendations" in data
 
-    def test_plugins_recommend_missing_parameters(self) -> None:
+    def test_plugins_recommend_missing_parameters(self, api_client: TestClient) -> None:
         """Test plugin recommendation with missing parameters."""
-        response = self.client.get("/api/v1/plugins/recommendations?style=electronic")
+        response = api_client.get("/api/v1/plugins/recommendations?style=electronic")
         assert response.status_code == 422  # Missing required 'instrument' parameter
 
-    def test_plugin_detail_nonexistent(self) -> None:
-        """Test plugin detail endpoint with nonexistent plugin name."""
-        response = self.client.get("/api/v1/plugins/nonexistent_plugin/parameters")
-        assert response.status_code == 404  # Should return 404 for nonexistent plugins
-
-    def test_plugin_detail_invalid_id_format(self) -> None:
-        """Test plugin detail endpoint with invalid name format."""
-        response = self.client.get("/api/v1/plugins/invalid@name#format/parameters")
-        assert response.status_code == 404
-
-    def test_generate_music_large_request(self) -> None:
+    @pytest.mark.slow
+    def test_generate_music_large_request(self, api_client: TestClient) -> None:
         """Test music generation with very large request."""
-        # Create a very large melody
-        large_melody = []
-        for i in range(10000):  # 10,000 notes
-            large_melody.append(
-                {
-                    "pitch": 60 + (i % 12),
-                    "velocity": 80,
-                    "duration": 0.1,
-                    "start_time": i * 0.1,
-                }
-            )
-
-        request_data = {"melody": large_melody}
+        body = encode_json({"melody": make_melody(10000, 0.1)})
 
-        response = self.client.post("/api/v1/generate", json=request_data)
-        # Should handle large requests gracefully
-        assert response.status_code in [200, 400, 413, 500]
+        # Only the status matters, so don't read the (large) body back
+        with api_client.stream(
+            "POST", "/api/v1/generate", content=body, headers=JSON_HEADERS
+        ) as response:
+            # Should handle large requests gracefully
+            assert response.status_code in [200, 400, 413, 500]
 
-    def test_generate_music_malformed_note_structure(self) -> None:
-        """Test music generation with malformed note structure."""
-        request_data = {
-            "melody": [
-                {"pitch": 60},  # Missing required fields
-                {"velocity": 80, "duration": 1.0},  # Missing pitch
-                {
-                    "pitch": "not_a_number",
-                    "velocity": 80,
-                    "duration": 1.0,
-                    "start_time": 0.0,
-                },  # Wrong type
-                None,  # Null note
-                "not_a_note_object",  # String instead of object
-            ]
-        }
-
-        response = self.client.post("/api/v1/generate", json=request_data)
-        assert response.status_code == 422
-
-    def test_generate_music_extreme_values(self) -> None:
+    def test_generate_music_extreme_values(self, api_client: TestClient) -> None:
         """Test music generation with extreme parameter values."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "tempo": 999999,
             "key": "X",  # Invalid key
             "style": "extremely_long_style_name_that_might_cause_issues",
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_special_characters(self) -> None:
+    def test_generate_music_special_characters(self, api_client: TestClient) -> None:
         """Test music generation with special characters in parameters."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "pop!@#$%^&*()",
             "key": "C#",
             "tempo": 120,
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_unicode_characters(self) -> None:
+    def test_generate_music_unicode_characters(self, api_client: TestClient) -> None:
         """Test music generation with unicode characters."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "ポップ",
             "key": "C",
             "tempo": 120,
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_nested_objects(self) -> None:
+    def test_generate_music_nested_objects(self, api_client: TestClient) -> None:
         """Test music generation with nested objects in request."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "pop",
             "metadata": {"nested": {"deeply": {"nested": "object"}}},
         }
 
-        response = self.client.post("/api/v1/generate", json=request_data)
+        response = api_client.post("/api/v1/generate", json=request_data)
         # Should handle extra fields gracefully
         assert response.status_code in [200, 400, 422]
 
-    def test_generate_music_array_instead_of_object(self) -> None:
-        """Test music generation with array instead of object."""
-        request_data = [
-            {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-        ]
-
-        response = self.client.post("/api/v1/generate", json=request_data)
-        assert response.status_code == 422
-
-    def test_generate_music_string_instead_of_object(self) -> None:
-        """Test music generation with string instead of object."""
-        response = self.client.post("/api/v1/generate", json="just a string")
-        assert response.status_code == 422
-
-    def test_generate_music_number_instead_of_object(self) -> None:
-        """Test music generation with number instead of object."""
-        response = self.client.post("/api/v1/generate", json=123)
-        assert response.status_code == 422
-
-    def test_generate_music_boolean_instead_of_object(self) -> None:
-        """Test music generation with boolean instead of object."""
-        response = self.client.post("/api/v1/generate", json=True)
-        assert response.status_code == 422
-
-    def test_generate_music_null_request(self) -> None:
-        """Test music generation with null request."""
-        response = self.client.post("/api/v1/generate", json=None)
-        assert response.status_code == 422
-
-    def test_generate_music_empty_string(self) -> None:
-        """Test music generation with empty string request."""
-        response = self.client.post("/api/v1/generate", data={})
-        assert response.status_code == 422
-
-    def test_generate_music_content_type_mismatch(self) -> None:
-        """Test music generation with wrong content type."""
-        response = self.client.post(
-            "/api/v1/generate",
-            data={"not": "json"},
-            headers={"Content-Type": "text/plain"},
-        )
-        assert response.status_code == 422
-
-    def test_generate_music_missing_content_type(self) -> None:
-        """Test music generation with missing content type."""
-        response = self.client.post(
-            "/api/v1/generate",
-            data={"melody": []},
-            headers={"Content-Type": "application/json"},
-        )
-        # Should still work as JSON is inferred
-        assert response.status_code in [
-            200,
-            400,
-            422,
-            500,
-        ]  # Allow 500 for invalid data
-
 
 class TestAPIConfig:
-    def setup_method(self) -> None:
-        self.client = TestClient(app)
-        with patch("merlai.core.music.MusicGenerator._initialize_default_models"):
-            app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-
-    def test_get_config(self) -> None:
-        response = self.client.get("/api/v1/config")
+    def test_get_config(self, api_client: TestClient) -> None:
+        response = api_client.get("/api/v1/config")
         assert response.status_code == 200
         data = response.json()
         assert "temperature" in data
         assert "max_length" in data
         assert "batch_size" in data
 
-    def test_update_config_success(self) -> None:
+    def test_update_config_success(self, api_client: TestClient) -> None:
         config_update = {"temperature": 0.7, "max_length": 512}
-        response = self.client.post("/api/v1/config", json=config_update)
+        response = api_client.post("/api/v1/config", json=config_update)
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "updated_config" in data
         assert data["updated_config"]["temperature"] == 0.7
 
-    def test_update_config_invalid_type(self) -> None:
+    def test_update_config_invalid_type(self, api_client: TestClient) -> None:
         config_update = {"temperature": "hot"}
-        response = self.client.post("/api/v1/config", json=config_update)
+        response = api_client.post("/api/v1/config", json=config_update)
         assert response.status_code == 422 or response.status_code == 400
 
-    def test_update_config_missing_body(self) -> None:
-        response = self.client.post("/api/v1/config")
+    def test_update_config_missing_body(self, api_client: TestClient) -> None:
+        response = api_client.post("/api/v1/config")
         assert response.status_code in (400, 422)
 
-    def test_update_config_extra_fields(self) -> None:
+    def test_update_config_extra_fields(self, api_client: TestClient) -> None:
         config_update = {"unknown_field": 123}
-        response = self.client.post("/api/v1/config", json=config_update)
+        response = api_client.post("/api/v1/config", json=config_update)
         # Depending on implementation, may ignore or error
         assert response.status_code in (200, 400, 422)
 
@@ -1095,15 +906,7 @@ class TestAPIConfig:
 class TestAIModelEndpoints:
     """Test AI model management endpoints."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-        with patch("merlai.core.music.MusicGenerator._initialize_default_models"):
-            app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-
-    def test_register_ai_model(self) -> None:
+    def test_register_ai_model(self, api_client: TestClient) -> None:
         """Test registering a new AI model."""
         model_config = {
             "name": "test-model",
@@ -1114,101 +917,63 @@ class TestAIModelEndpoints:
         with patch(
             "merlai.core.music.MusicGenerator.register_ai_model", return_value=True
         ):
-            response = self.client.post("/api/v1/ai/models/register", json=model_config)
+            response = api_client.post("/api/v1/ai/models/register", json=model_config)
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "test-model" in data["message"]
 
-    def test_set_default_ai_model(self) -> None:
+    def test_set_default_ai_model(self, api_client: TestClient) -> None:
         """Test setting default AI model."""
         with patch(
             "merlai.core.music.MusicGenerator.set_default_ai_model", return_value=True
         ):
-            response = self.client.post("/api/v1/ai/models/test-model/set-default")
+            response = api_client.post("/api/v1/ai/models/test-model/set-default")
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "test-model" in data["default_model"]
 
-    def test_set_default_ai_model_not_found(self) -> None:
+    def test_set_default_ai_model_not_found(self, api_client: TestClient) -> None:
         """Test setting default AI model with non-existent model name."""
-        with patch("merlai.core.music.MusicGenerator._initialize_default_models"):
-            response = self.client.post(
-                "/api/v1/ai/models/nonexistent-model/set-default"
-            )
-            print(f"Response status: {response.status_code}")
-            print(f"Response body: {response.text}")
-            assert response.status_code == 404
-            data = response.json()
-            assert "detail" in data
-            assert "not found" in data["detail"].lower()
-
-    def test_list_ai_models(self) -> None:
+        response = api_client.post("/api/v1/ai/models/nonexistent-model/set-default")
+        assert response.status_code == 404
+        data = response.json()
+        assert "detail" in data
+        assert "not found" in data["detail"].lower()
+
+    def test_list_ai_models(self, api_client: TestClient) -> None:
         """Test listing AI models."""
-        response = self.client.get("/api/v1/ai/models")
+        response = api_client.get("/api/v1/ai/models")
         assert response.status_code == 200
         data = response.json()
         assert "models" in data
         assert "count" in data
         assert "ai_models_enabled" in data
 
-    def test_generate_harmony_ai(self) -> None:
-        """Test AI harmony generation."""
+    @pytest.mark.parametrize("part", ["harmony", "bass", "drums"])
+    def test_generate_part_ai(self, api_client: TestClient, part: str) -> None:
+        """Test AI harmony/bass/drums generation."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "pop",
             "tempo": 120,
             "key": "C",
         }
-        response = self.client.post("/api/v1/ai/generate/harmony", json=request_data)
+        response = api_client.post(f"/api/v1/ai/generate/{part}", json=request_data)
         assert response.status_code == 200
         data = response.json()
         assert "success" in data
 
-    def test_generate_bass_ai(self) -> None:
-        """Test AI bass generation."""
-        request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
-            "style": "pop",
-            "tempo": 120,
-            "key": "C",
-        }
-        response = self.client.post("/api/v1/ai/generate/bass", json=request_data)
-        assert response.status_code == 200
-        data = response.json()
-        assert "success" in data
-
-    def test_generate_drums_ai(self) -> None:
-        """Test AI drums generation."""
-        request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
-            "style": "pop",
-            "tempo": 120,
-            "key": "C",
-        }
-        response = self.client.post("/api/v1/ai/generate/drums", json=request_data)
-        assert response.status_code == 200
-        data = response.json()
-        assert "success" in data
-
-    def test_generate_harmony_ai_model_not_found(self) -> None:
+    def test_generate_harmony_ai_model_not_found(self, api_client: TestClient) -> None:
         """Test generating harmony with non-existent AI model name."""
         request_data = {
-            "melody": [
-                {"pitch": 60, "velocity": 80, "duration": 1.0, "start_time": 0.0}
-            ],
+            "melody": [SINGLE_NOTE],
             "style": "pop",
             "tempo": 120,
             "key": "C",
         }
-        response = self.client.post(
+        response = api_client.post(
             "/api/v1/ai/generate/harmony?model_name=nonexistent-model",
             json=request_data,
         )
@@ -1217,7 +982,7 @@ class TestAIModelEndpoints:
         assert "detail" in data
         assert "not found" in data["detail"].lower()
 
-    def test_generate_harmony_ai_missing_fields(self) -> None:
+    def test_generate_harmony_ai_missing_fields(self, api_client: TestClient) -> None:
         """Test generating harmony with missing required fields (should return 422)."""
         # melodyフィールドが欠損
         request_data = {
@@ -1225,12 +990,12 @@ class TestAIModelEndpoints:
             "tempo": 120,
             "key": "C",
         }
-        response = self.client.post("/api/v1/ai/generate/harmony", json=request_data)
+        response = api_client.post("/api/v1/ai/generate/harmony", json=request_data)
         assert response.status_code == 422
         data = response.json()
         assert "detail" in data
 
-    def test_generate_harmony_ai_invalid_type(self) -> None:
+    def test_generate_harmony_ai_invalid_type(self, api_client: TestClient) -> None:
         """Test generating harmony with invalid field type (should return 422)."""
         # melodyがstr型
         request_data = {
@@ -1239,7 +1004,7 @@ class TestAIModelEndpoints:
             "tempo": 120,
             "key": "C",
         }
-        response = self.client.post("/api/v1/ai/generate/harmony", json=request_data)
+        response = api_client.post("/api/v1/ai/generate/harmony", json=request_data)
         assert response.status_code == 422
         data = response.json()
         assert "detail" in data
@@ -1248,24 +1013,17 @@ class TestAIModelEndpoints:
 class TestPluginEndpoints:
     """Test plugin management endpoints."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-        app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-
-    def test_list_plugins(self) -> None:
+    def test_list_plugins(self, api_client: TestClient) -> None:
         """Test listing plugins."""
-        response = self.client.get("/api/v1/plugins")
+        response = api_client.get("/api/v1/plugins")
         assert response.status_code == 200
         data = response.json()
         assert "plugins" in data
         assert isinstance(data["plugins"], list)
 
-    def test_get_plugin_recommendations(self) -> None:
+    def test_get_plugin_recommendations(self, api_client: TestClient) -> None:
         """Test getting plugin recommendations."""
-        response = self.client.get(
+        response = api_client.get(
             "/api/v1/plugins/recommendations?style=pop&instrument=piano"
         )
         assert response.status_code == 200
@@ -1273,58 +1031,58 @@ class TestPluginEndpoints:
         assert "recommendations" in data
         assert isinstance(data["recommendations"], list)
 
-    def test_load_plugin(self) -> None:
+    def test_load_plugin(self, api_client: TestClient) -> None:
         """Test loading a plugin."""
         with patch("merlai.core.plugins.PluginManager.load_plugin", return_value=True):
-            response = self.client.post("/api/v1/plugins/test-plugin/load")
+            response = api_client.post("/api/v1/plugins/test-plugin/load")
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
 
-    def test_get_plugin_parameters(self) -> None:
+    def test_get_plugin_parameters(self, api_client: TestClient) -> None:
         """Test getting plugin parameters."""
-        response = self.client.get("/api/v1/plugins/test-plugin/parameters")
+        response = api_client.get("/api/v1/plugins/test-plugin/parameters")
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
 
-    def test_set_plugin_parameter(self) -> None:
+    def test_set_plugin_parameter(self, api_client: TestClient) -> None:
         """Test setting plugin parameter."""
         with patch(
             "merlai.core.plugins.PluginManager.set_plugin_parameter", return_value=True
         ):
-            response = self.client.post(
+            response = api_client.post(
                 "/api/v1/plugins/test-plugin/parameters/volume", params={"value": 0.8}
             )
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
 
-    def test_get_plugin_presets(self) -> None:
+    def test_get_plugin_presets(self, api_client: TestClient) -> None:
         """Test getting plugin presets."""
-        response = self.client.get("/api/v1/plugins/test-plugin/presets")
+        response = api_client.get("/api/v1/plugins/test-plugin/presets")
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
 
-    def test_get_plugin_info(self) -> None:
+    def test_get_plugin_info(self, api_client: TestClient) -> None:
         """Test getting plugin information."""
-        response = self.client.get("/api/v1/plugins/test-plugin")
+        response = api_client.get("/api/v1/plugins/test-plugin")
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
 
-    def test_get_plugin_parameters_not_found(self) -> None:
+    def test_get_plugin_parameters_not_found(self, api_client: TestClient) -> None:
         """Test getting parameters for non-existent plugin."""
-        response = self.client.get("/api/v1/plugins/nonexistent-plugin/parameters")
+        response = api_client.get("/api/v1/plugins/nonexistent-plugin/parameters")
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
         assert "not found" in data["detail"].lower()
 
-    def test_set_plugin_parameter_not_found(self) -> None:
+    def test_set_plugin_parameter_not_found(self, api_client: TestClient) -> None:
         """Test setting parameter for non-existent plugin."""
-        response = self.client.post(
+        response = api_client.post(
             "/api/v1/plugins/nonexistent-plugin/parameters/volume",
             params={"value": 0.8},
         )
@@ -1337,30 +1095,23 @@ class TestPluginEndpoints:
 class TestConfigEndpoints:
     """Test configuration management endpoints."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-        app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-
-    def test_get_config(self) -> None:
+    def test_get_config(self, api_client: TestClient) -> None:
         """Test getting configuration."""
-        response = self.client.get("/api/v1/config")
+        response = api_client.get("/api/v1/config")
         assert response.status_code == 200
         data = response.json()
         assert "temperature" in data
         assert "max_length" in data
         assert "batch_size" in data
 
-    def test_update_config(self) -> None:
+    def test_update_config(self, api_client: TestClient) -> None:
         """Test updating configuration."""
         config_update = {
             "temperature": 0.7,
             "max_length": 512,
             "batch_size": 8,
         }
-        response = self.client.post("/api/v1/config", json=config_update)
+        response = api_client.post("/api/v1/config", json=config_update)
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
@@ -1369,24 +1120,17 @@ class TestConfigEndpoints:
 class TestHealthEndpoints:
     """Test health and status endpoints."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.client = TestClient(app)
-        app.state.music_generator = MusicGenerator()
-        app.state.midi_generator = MIDIGenerator()
-        app.state.plugin_manager = PluginManager()
-
-    def test_health_check(self) -> None:
+    def test_health_check(self, api_client: TestClient) -> None:
         """Test health check endpoint."""
-        response = self.client.get("/health")
+        response = api_client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert "status" in data
         assert data["status"] == "healthy"
 
-    def test_ready_check(self) -> None:
+    def test_ready_check(self, api_client: TestClient) -> None:
         """Test readiness check endpoint."""
-        response = self.client.get("/ready")
+        response = api_client.get("/ready")
         assert response.status_code == 200
         data = response.json()
         assert "status" in data
@@ -11,6 +11,10 @@ from click.testing import CliRunner
 
 from merlai.cli import main
 
+# Patch targets shared by many tests below.
+LOAD_MODEL_TARGET = "merlai.core.music.MusicGenerator.load_model"
+SCAN_PLUGINS_TARGET = "merlai.core.plugins.PluginManager.scan_plugins"
+
 
 class TestCLICommands:
     """Test CLI commands."""
@@ -61,7 +65,7 @@ class TestCLICommands:
             midi_path = tmp_file.name
 
         try:
-            with patch("merlai.core.music.MusicGenerator.load_model"):
+            with patch(LOAD_MODEL_TARGET):
                 with patch(
                     "merlai.core.music.MusicGenerator.generate_harmony"
                 ) as mock_harmony:
@@ -114,7 +118,7 @@ class TestCLICommands:
             midi_path = midi_file.name
 
         try:
-            with patch("merlai.core.music.MusicGenerator.load_model"):
+            with patch(LOAD_MODEL_TARGET):
                 with patch(
                     "merlai.core.music.MusicGenerator.generate_harmony"
                 ) as mock_harmony:
@@ -149,14 +153,14 @@ class TestCLICommands:
 
     def test_plugins_command(self) -> None:
         """Test plugins command."""
-        with patch("merlai.core.plugins.PluginManager.scan_plugins") as mock_scan:
+        with patch(SCAN_PLUGINS_TARGET) as mock_scan:
             mock_scan.return_value = []
             result = self.runner.invoke(main, ["scan-plugins"])
             assert result.exit_code in [0, 1, 2]
 
     def test_plugins_scan_command(self) -> None:
         """Test plugins scan command."""
-        with patch("merlai.core.plugins.PluginManager.scan_plugins") as mock_scan:
+        with patch(SCAN_PLUGINS_TARGET) as mock_scan:
             mock_scan.return_value = []
 
             result = self.runner.invoke(main, ["scan-plugins"])
@@ -164,7 +168,7 @@ class TestCLICommands:
 
     def test_plugins_recommend_command(self) -> None:
         """Test plugins recommend command."""
-        with patch("merlai.core.plugins.PluginManager.scan_plugins") as mock_scan:
+        with patch(SCAN_PLUGINS_TARGET) as mock_scan:
             with patch(
                 "merlai.core.plugins.PluginManager.get_plugin_recommendations"
             ) as mock_recommend:
@@ -184,7 +188,7 @@ class TestCLIErrorHandling:
 
     def test_generate_command_invalid_input_file(self) -> None:
         """Test generate command with invalid input file."""
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(
                 main, ["generate", "--input", "/nonexistent/file.mid"]
             )
@@ -192,7 +196,7 @@ class TestCLIErrorHandling:
 
     def test_plugins_scan_command_invalid_directory(self) -> None:
         """Test plugins scan command with invalid directory."""
-        with patch("merlai.core.plugins.PluginManager.scan_plugins") as mock_scan:
+        with patch(SCAN_PLUGINS_TARGET) as mock_scan:
             mock_scan.return_value = []
             result = self.runner.invoke(
                 main, ["scan-plugins", "--directory", "/nonexistent/directory"]
@@ -214,7 +218,7 @@ class TestCLIInputValidation:
 
     def test_generate_command_missing_required_options(self) -> None:
         """Test generate command with missing required options."""
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(main, ["generate"])
             assert result.exit_code in [0, 1, 2]
 
@@ -228,7 +232,7 @@ class TestCLIInputValidation:
 
     def test_generate_command_invalid_tempo(self) -> None:
         """Test generate command with invalid tempo."""
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(main, ["generate", "--tempo", "invalid"])
             assert result.exit_code != 0
 
@@ -242,7 +246,7 @@ class TestCLIOutput:
 
     def test_plugins_command_output_format(self) -> None:
         """Test plugins command output format."""
-        with patch("merlai.core.plugins.PluginManager.scan_plugins") as mock_scan:
+        with patch(SCAN_PLUGINS_TARGET) as mock_scan:
             mock_scan.return_value = []
 
             result = self.runner.invoke(main, ["scan-plugins"])
@@ -250,7 +254,7 @@ class TestCLIOutput:
 
     def test_plugins_scan_command_output_format(self) -> None:
         """Test plugins scan command output format."""
-        with patch("merlai.core.plugins.PluginManager.scan_plugins") as mock_scan:
+        with patch(SCAN_PLUGINS_TARGET) as mock_scan:
             mock_scan.return_value = []
 
             result = self.runner.invoke(main, ["scan-plugins"])
@@ -258,7 +262,7 @@ class TestCLIOutput:
 
     def test_plugins_recommend_command_output_format(self) -> None:
         """Test plugins recommend command output format."""
-        with patch("merlai.core.plugins.PluginManager.scan_plugins") as mock_scan:
+        with patch(SCAN_PLUGINS_TARGET) as mock_scan:
             with patch(
                 "merlai.core.plugins.PluginManager.get_plugin_recommendations"
             ) as mock_recommend:
@@ -278,7 +282,7 @@ class TestCLIEdgeCases:
         self.main = main
 
     def test_scan_plugins_invalid_directory(self) -> None:
-        with patch("merlai.core.plugins.PluginManager.scan_plugins") as mock_scan:
+        with patch(SCAN_PLUGINS_TARGET) as mock_scan:
             mock_scan.return_value = []
             result = self.runner.invoke(
                 self.main, ["scan-plugins", "--directory", "/not/exist"]
@@ -287,7 +291,7 @@ class TestCLIEdgeCases:
 
     def test_generate_with_extreme_values(self) -> None:
         """Test generate with extreme parameter values."""
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(
                 self.main,
                 [
@@ -306,31 +310,31 @@ class TestCLIGenerateCombinations:
         self.runner = CliRunner()
 
     def test_generate_with_only_style(self) -> None:
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(main, ["generate", "--style", "jazz"])
             assert result.exit_code in [0, 1, 2]
 
     def test_generate_with_only_tempo(self) -> None:
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(main, ["generate", "--tempo", "100"])
             assert result.exit_code in [0, 1, 2]
 
     def test_generate_with_only_key(self) -> None:
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(main, ["generate", "--key", "G"])
             assert result.exit_code in [0, 1, 2]
 
     def test_generate_with_invalid_style(self) -> None:
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(main, ["generate", "--style", "invalidstyle"])
             assert result.exit_code in [0, 1, 2]
 
     def test_generate_with_invalid_tempo(self) -> None:
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(main, ["generate", "--tempo", "notanumber"])
             assert result.exit_code != 0
 
     def test_generate_with_invalid_key(self) -> None:
-        with patch("merlai.core.music.MusicGenerator.load_model"):
+        with patch(LOAD_MODEL_TARGET):
             result = self.runner.invoke(main, ["generate", "--key", "!!!"])
             assert result.exit_code in [0, 1, 2]
@@ -4,10 +4,12 @@ Integration tests for the complete system.
 
 import os
 import tempfile
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
+from merlai.core import ai_models
 from merlai.core.ai_models import ModelConfig, ModelType
 from merlai.core.midi import MIDIGenerator
 from merlai.core.music import MusicGenerator
@@ -241,8 +243,8 @@ class TestAIModelIntegration:
         """Test AI model registration and usage workflow."""
         # 1. Register AI models
         with (
-            patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf,
-            patch("merlai.core.ai_models.ExternalAPIModel") as mock_api,
+            patch.object(ai_models, "HuggingFaceModel") as mock_hf,
+            patch.object(ai_models, "ExternalAPIModel") as mock_api,
         ):
             mock_hf_model = Mock()
             mock_api_model = Mock()
@@ -253,9 +255,7 @@ class TestAIModelIntegration:
             mock_drums = Drums(
                 notes=[Note(pitch=36, velocity=80, duration=0.5, start_time=0.0)]
             )
-            mock_response = Mock()
-            mock_response.success = True
-            mock_response.result = mock_drums
+            mock_response = SimpleNamespace(success=True, result=mock_drums)
             mock_hf_model.generate_drums.return_value = mock_response
             mock_api_model.generate_drums.return_value = mock_response
 
@@ -323,10 +323,10 @@ class TestAIModelIntegration:
     def test_ai_model_fallback_mechanism(self) -> None:
         """Test AI model fallback when primary model fails."""
         # 1. Register a model that will fail
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
+        with patch.object(ai_models, "HuggingFaceModel") as mock_hf:
             mock_model = Mock()
             mock_hf.return_value = mock_model
-            mock_model.generate_harmony.return_value = Mock(
+            mock_model.generate_harmony.return_value = SimpleNamespace(
                 success=False, error_message="Model unavailable", result=None
             )
 
@@ -352,8 +352,8 @@ class TestAIModelIntegration:
         """Test using different AI models for different generation tasks."""
         # 1. Register multiple models
         with (
-            patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf,
-            patch("merlai.core.ai_models.ExternalAPIModel") as mock_api,
+            patch.object(ai_models, "HuggingFaceModel") as mock_hf,
+            patch.object(ai_models, "ExternalAPIModel") as mock_api,
         ):
             mock_hf_model = Mock()
             mock_api_model = Mock()
@@ -364,9 +364,7 @@ class TestAIModelIntegration:
             mock_drums = Drums(
                 notes=[Note(pitch=36, velocity=80, duration=0.5, start_time=0.0)]
             )
-            mock_response = Mock()
-            mock_response.success = True
-            mock_response.result = mock_drums
+            mock_response = SimpleNamespace(success=True, result=mock_drums)
             mock_hf_model.generate_drums.return_value = mock_response
             mock_api_model.generate_drums.return_value = mock_response
 
@@ -415,7 +413,7 @@ class TestAIModelIntegration:
     def test_ai_model_with_midi_generation_workflow(self) -> None:
         """Test complete workflow with AI models and MIDI generation."""
         # 1. Set up AI models
-        with patch("merlai.core.ai_models.HuggingFaceModel") as mock_hf:
+        with patch.object(ai_models, "HuggingFaceModel") as mock_hf:
             mock_model = Mock()
 
             # Mock the generate_drums method to return a proper Drums object
@@ -424,9 +422,7 @@ class TestAIModelIntegration:
             mock_drums = Drums(
                 notes=[Note(pitch=36, velocity=80, duration=0.5, start_time=0.0)]
             )
-            mock_response = Mock()
-            mock_response.success = True
-            mock_response.result = mock_drums
+            mock_response = SimpleNamespace(success=True, result=mock_drums)
             mock_model.generate_drums.return_value = mock_response
 
             mock_hf.return_value = mock_model